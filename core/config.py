@@ -3,71 +3,101 @@
 환경변수와 설정값들을 중앙에서 관리
 """
 
-import os
-from typing import List
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from pydantic import computed_field, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
-    """애플리케이션 설정 클래스"""
-    
+    """
+    애플리케이션 설정 클래스
+
+    각 필드는 pydantic-settings가 대소문자 구분 없이 동일한 이름의 환경변수
+    (예: openai_api_key ← OPENAI_API_KEY)에서 한 번만 읽어 파싱합니다.
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",  # 추가 필드 허용
+    )
+
     # API 키 설정
-    openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
-    naver_client_id: str = os.getenv("NAVER_CLIENT_ID", "")
-    naver_client_secret: str = os.getenv("NAVER_CLIENT_SECRET", "")
-    
+    openai_api_key: str = ""
+    naver_client_id: str = ""
+    naver_client_secret: str = ""
+
     # 환경 설정
-    environment: str = os.getenv("ENVIRONMENT", "development")
-    is_production: bool = os.getenv("ENVIRONMENT") == "production"
-    
-    # CORS 설정
-    allowed_origins: List[str] = [
+    environment: str = "development"
+
+    # CORS 설정 (불변 튜플로 보관)
+    allowed_origins: Tuple[str, ...] = (
         "http://localhost:3000",
-        "http://localhost:3001", 
+        "http://localhost:3001",
         "http://localhost:8000",
         "https://localhost:3000",
         "https://ai.studio"  # AI Studio 도메인
-    ]
-    
+    )
+    # 추가 허용 Origin 정규식 (예: r"https://(ai\.studio|app\.example\.com)", 미설정 시 사용 안 함)
+    allowed_origin_regex: Optional[str] = None
+
     # API 설정
     api_title: str = "AI 정치 컬럼니스트 API"
     api_version: str = "1.0.0"
-    
+
     # Rate Limiting 설정
-    rate_limit_per_minute: int = int(os.getenv("RATE_LIMIT_PER_MINUTE", "5"))
-    
+    rate_limit_per_minute: int = 5
+
     # 요청 크기 제한 (바이트)
-    max_request_size: int = int(os.getenv("MAX_REQUEST_SIZE", "1048576"))  # 1MB
-    
+    max_request_size: int = 1048576  # 1MB
+
     # Lambda 설정
-    lambda_timeout: int = int(os.getenv("LAMBDA_TIMEOUT", "300"))  # 5분
-    lambda_memory_size: int = int(os.getenv("LAMBDA_MEMORY_SIZE", "1024"))  # 1GB
-    
+    lambda_timeout: int = 300  # 5분
+    lambda_memory_size: int = 1024  # 1GB
+
     # 컬럼 생성 설정
-    max_column_length: int = int(os.getenv("MAX_COLUMN_LENGTH", "5000"))
-    min_column_length: int = int(os.getenv("MIN_COLUMN_LENGTH", "500"))
-    default_revision_attempts: int = int(os.getenv("DEFAULT_REVISION_ATTEMPTS", "3"))
-    
+    max_column_length: int = 5000
+    min_column_length: int = 500
+    default_revision_attempts: int = 3
+    # 초안 후보 수 (2 이상이면 후보를 한 번에 생성해 첫 평가를 동시에 수행, 비용 증가)
+    draft_candidates: int = 1
+    # 동일 컨텐츠 평가 결과 캐시 크기 (0이면 비활성화, 컨텐츠가 프로세스 메모리에 남으므로 기본 꺼짐)
+    evaluation_cache_size: int = 0
+    # 동일 조건(주제/기간/검색 범위) 뉴스 검색 결과 캐시 크기와 유지 시간 (0이면 비활성화)
+    news_cache_size: int = 128
+    news_cache_ttl: int = 300  # 5분
+
     # 로깅 설정
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        
-        # 필수 환경변수 검증
+    log_level: str = "INFO"
+    # 로그 출력 형식 ("text": 기본 텍스트, "json": 한 줄 JSON - 로그 수집기용)
+    log_format: str = "text"
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def is_production(self) -> bool:
+        """프로덕션 환경 여부 (environment 값에서 파생)"""
+        return self.environment == "production"
+
+    @model_validator(mode="after")
+    def _validate_required(self) -> "Settings":
+        """필수 환경변수 검증"""
         if not self.openai_api_key:
             raise ValueError("OPENAI_API_KEY 환경변수가 설정되지 않았습니다.")
-        
-        # 프로덕션 환경에서 추가 검증
-        if self.is_production:
-            if self.environment != "production":
-                raise ValueError("프로덕션 환경에서는 ENVIRONMENT=production 이어야 합니다.")
+        return self
+
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        extra = "ignore"  # 추가 필드 허용
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    설정 인스턴스 반환 (프로세스당 1회만 생성)
 
+    import 시점이 아닌 최초 호출 시점에 환경변수를 검증하며,
+    테스트에서는 get_settings.cache_clear()로 재생성할 수 있습니다.
 
-# 전역 설정 인스턴스
-settings = Settings()
\ No newline at end of file
+    Returns:
+        Settings: 캐시된 설정 인스턴스
+    """
+    return Settings()
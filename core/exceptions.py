@@ -78,4 +78,11 @@ class NewsSearchException(CustomHTTPException):
             status_code=503,
             detail=detail,
             error_code="NEWS_SEARCH_ERROR"
-        )
\ No newline at end of file
+        )
+
+
+class EvaluationTimeoutException(ContentGenerationException):
+    """품질 평가 API 응답 시간 초과 예외"""
+    
+    def __init__(self, detail: str = "평가 API 응답 시간이 초과되었습니다."):
+        super().__init__(detail=detail)
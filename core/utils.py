@@ -0,0 +1,77 @@
+"""
+공통 유틸리티 함수
+여러 모듈에서 함께 사용하는 작은 헬퍼들
+"""
+
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Tuple
+
+import orjson
+
+# 마지막으로 포맷한 (epoch 초, ISO 문자열) - 같은 초 안의 호출은 포맷을 재사용
+# (튜플 한 번의 대입으로 갱신하므로 스레드 간에도 일관된 쌍을 읽음)
+_last_iso: Tuple[int, str] = (-1, "")
+
+
+def utc_now_iso() -> str:
+    """
+    현재 UTC 시각을 ISO 8601 문자열로 반환 (예: "2024-01-01T00:00:00Z")
+
+    time.strftime의 로케일 처리 경로를 거치지 않고 timezone-aware datetime을
+    초 단위로 포맷합니다. 결과가 초 단위이므로 같은 초 안에서는 캐시된 문자열을 반환합니다.
+
+    Returns:
+        str: 'Z' 접미사가 붙은 ISO 8601 UTC 타임스탬프
+    """
+    global _last_iso
+    second = int(time.time())
+    cached_second, cached_iso = _last_iso
+    if second == cached_second:
+        return cached_iso
+    iso = (
+        datetime.fromtimestamp(second, timezone.utc)
+        .isoformat()
+        .replace("+00:00", "Z")
+    )
+    _last_iso = (second, iso)
+    return iso
+
+
+# LogRecord 기본 속성 (extra로 전달된 필드만 골라내기 위해 사용)
+_LOG_RECORD_ATTRS = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", None, None))
+) | {"message", "asctime"}
+
+
+class JsonLogFormatter(logging.Formatter):
+    """
+    로그 레코드를 한 줄 JSON으로 직렬화하는 포매터 (orjson 사용)
+
+    logger 호출 시 extra로 전달한 필드는 같은 JSON 객체에 그대로 포함되므로
+    로그 수집기에서 별도 파싱 없이 조회할 수 있습니다.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        로그 레코드를 JSON 문자열로 변환
+
+        Args:
+            record: 로그 레코드
+
+        Returns:
+            str: 한 줄 JSON 문자열
+        """
+        payload: Dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _LOG_RECORD_ATTRS:
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload, default=str).decode()
@@ -4,15 +4,15 @@ AI API를 활용한 정치 컬럼 생성 서비스
 """
 
 import os
-from typing import Dict, Any, Optional
-from datetime import datetime
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Tuple
 import logging
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from mangum import Mangum
-import google.generativeai as genai
+from fastapi.responses import ORJSONResponse
+from cachetools import TTLCache
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
@@ -25,23 +25,37 @@ from schemas import (
     ErrorResponse,
     NewsPreviewResponse,
     NewsSearchResult,
+    Source,
     ColumnGenerationConfirmRequest
 )
-from services.gemini_service import GeminiService
-from core.config import settings
+from core.config import get_settings
 from core.exceptions import CustomHTTPException
+from core.utils import JsonLogFormatter, utc_now_iso
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO)
+if TYPE_CHECKING:
+    from services.gemini_service import GeminiService
+
+# 설정 로드 (lru_cache로 프로세스당 1회만 생성)
+settings = get_settings()
+
+# 로깅 설정 (LOG_LEVEL 환경변수로 루트 로거 레벨 지정)
+logging.basicConfig(level=settings.log_level.upper())
 logger = logging.getLogger(__name__)
 
+# JSON 로그 형식이면 extra 필드까지 한 번에 직렬화하도록 루트 핸들러 포매터 교체
+if settings.log_format == "json":
+    for log_handler in logging.getLogger().handlers:
+        log_handler.setFormatter(JsonLogFormatter())
+
 # FastAPI 앱 초기화
 app = FastAPI(
     title="AI 정치 컬럼니스트 API",
     description="AI API를 활용한 정치 컬럼 생성 서비스",
     version="1.0.0",
     docs_url="/docs" if not settings.is_production else None,
-    redoc_url="/redoc" if not settings.is_production else None
+    redoc_url="/redoc" if not settings.is_production else None,
+    # 한글 본문이 긴 응답이 많아 C 구현 orjson으로 직렬화 (UTF-8 직접 인코딩)
+    default_response_class=ORJSONResponse
 )
 
 # Rate Limiter 설정
@@ -53,10 +67,12 @@ app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.allowed_origins,
+    allow_origin_regex=settings.allowed_origin_regex,
     allow_credentials=True,
     allow_methods=["GET", "POST"],
     allow_headers=["*"],
-    max_age=600  # 10분 동안 preflight 캐시
+    # preflight 캐시: 프로덕션 2시간(Chromium 상한), 개발 환경은 설정 변경 확인을 위해 10분
+    max_age=7200 if settings.is_production else 600
 )
 
 # 보안 미들웨어 추가
@@ -66,27 +82,110 @@ app.add_middleware(SecurityMiddleware)
 app.add_middleware(InputSanitizationMiddleware)
 app.add_middleware(RequestLoggingMiddleware)
 
-# AI 서비스 인스턴스 생성 (OpenAI + 네이버 API 키 포함)
-gemini_service = GeminiService(
-    openai_api_key=settings.openai_api_key,  # OpenAI API 키
-    naver_client_id=settings.naver_client_id if settings.naver_client_id else None,
-    naver_client_secret=settings.naver_client_secret if settings.naver_client_secret else None
-)
+@lru_cache(maxsize=1)
+def get_gemini_service() -> "GeminiService":
+    """
+    AI 서비스 인스턴스 반환 (최초 요청 시 1회만 생성)
+
+    OpenAI/네이버 클라이언트 생성과 서비스 모듈 import를 첫 호출까지 미뤄
+    /health 등 AI 서비스가 필요 없는 경로의 콜드 스타트 비용을 줄입니다.
+
+    Returns:
+        GeminiService: 캐시된 AI 서비스 인스턴스
+    """
+    from services.gemini_service import GeminiService
+
+    return GeminiService(
+        openai_api_key=settings.openai_api_key,  # OpenAI API 키
+        naver_client_id=settings.naver_client_id if settings.naver_client_id else None,
+        naver_client_secret=settings.naver_client_secret if settings.naver_client_secret else None,
+        draft_candidates=settings.draft_candidates,
+        evaluation_cache_size=settings.evaluation_cache_size,
+        news_cache_size=settings.news_cache_size,
+        news_cache_ttl=settings.news_cache_ttl
+    )
+
+# 뉴스 데이터 임시 캐시 (메모리 기반, 최대 256개 / 10분 후 자동 만료)
+# 키: "topic_daysBack_searchMode", 값: (news_data: List[dict], sources: List[SourceDict])
+news_cache: "TTLCache[str, Tuple[List[dict], List[Any]]]" = TTLCache(maxsize=256, ttl=600)
+# TTLCache는 조회 시에도 만료 항목을 정리하므로 모든 접근을 잠금으로 보호
+news_cache_lock = threading.RLock()
+
+
+def _normalize_sources(sources: Optional[Iterable[Any]]) -> Optional[List[Source]]:
+    """
+    Source 입력을 Source 모델 목록으로 정규화
+    (서비스의 SourceDict, Source 모델, 테스트용 Mock 객체 모두 허용)
+    
+    Args:
+        sources: 서비스가 반환한 참고 자료 목록
+        
+    Returns:
+        Optional[List[Source]]: 정규화된 참고 자료 목록 (없으면 None)
+    """
+    if not sources:
+        return None
+    
+    # 서버가 직접 만든 값이므로 검증 없이 model_construct로 생성
+    normalized = []
+    for source in sources:
+        if isinstance(source, dict):
+            normalized.append(Source.model_construct(title=source.get("title", ""), uri=source.get("uri", "")))
+        else:
+            # getattr 기본값을 사용하므로 속성이 없어도 예외가 발생하지 않음
+            normalized.append(Source.model_construct(title=getattr(source, "title", ""), uri=getattr(source, "uri", "")))
+    return normalized
+
 
-# 뉴스 데이터 임시 캐시 (메모리 기반)
-# 키: "topic_daysBack_searchMode", 값: {"news_data": List[dict], "sources": List[Source], "timestamp": datetime}
-news_cache: Dict[str, Dict[str, Any]] = {}
+def _build_column_response(article_content: Any, category: str) -> ColumnResponse:
+    """
+    서비스가 생성한 컬럼으로 API 응답 구성 (두 컬럼 생성 엔드포인트 공용)
+    
+    Args:
+        article_content: 서비스가 반환한 생성 컨텐츠 (title/summary/content/sources)
+        category: 메타데이터 카테고리
+        
+    Returns:
+        ColumnResponse: 응답 모델 (내부에서 만든 값이므로 생성 시 검증 생략)
+    """
+    # 메타데이터 생성
+    word_count = len(article_content.content) - article_content.content.count(" ")
+    created_date = utc_now_iso()
+    
+    # 요약 길이 가드(<=300자). 초과 시 말줄임표 추가
+    safe_summary = article_content.summary
+    if isinstance(safe_summary, str) and len(safe_summary) > 300:
+        safe_summary = (safe_summary[:297]).rstrip() + "..."
+
+    # Source 모델 입력 정규화
+    normalized_sources = _normalize_sources(getattr(article_content, "sources", None))
+
+    return ColumnResponse.model_construct(
+        success=True,
+        article=ArticleData.model_construct(
+            title=article_content.title,
+            summary=safe_summary,
+            content=article_content.content,
+            metadata=MetaData.model_construct(
+                wordCount=word_count,
+                category=category,
+                createdDate=created_date,
+                sources=normalized_sources
+            )
+        ),
+        processedDate=created_date
+    )
 
 
 @app.exception_handler(CustomHTTPException)
 async def custom_exception_handler(request: Request, exc: CustomHTTPException):
     """커스텀 예외 처리기"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=ErrorResponse(
             success=False,
             error=exc.detail,
-            processedDate=datetime.utcnow().isoformat() + "Z"
+            processedDate=utc_now_iso()
         ).model_dump()
     )
 
@@ -95,30 +194,41 @@ async def custom_exception_handler(request: Request, exc: CustomHTTPException):
 async def general_exception_handler(request: Request, exc: Exception):
     """일반 예외 처리기"""
     logger.error(f"Unexpected error: {str(exc)}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content=ErrorResponse(
             success=False,
             error="서버 내부 오류가 발생했습니다.",
-            processedDate=datetime.utcnow().isoformat() + "Z"
+            processedDate=utc_now_iso()
         ).model_dump()
     )
 
 
 @app.get("/health")
+@limiter.exempt  # 로드밸런서 헬스 체크는 Rate Limit 대상에서 제외
 async def health_check():
     """헬스 체크 엔드포인트"""
-    return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
+    return {"status": "healthy", "timestamp": utc_now_iso()}
 
 
-@app.post("/api/generate-column", response_model=ColumnResponse)
+# model_construct로 만든 응답을 다시 검증하지 않도록 response_model 없이 반환 (문서 스키마는 responses로 유지)
+@app.post(
+    "/api/generate-column",
+    response_model=None,
+    responses={200: {"model": ColumnResponse}}
+)
 @limiter.limit("5/minute")  # 분당 5회 요청 제한
-async def generate_column(request: Request, column_request: ColumnRequest):
+async def generate_column(
+    request: Request,
+    column_request: ColumnRequest,
+    service: "GeminiService" = Depends(get_gemini_service)
+) -> ColumnResponse:
     """
     정치 컬럼 생성 API 엔드포인트
     
     Args:
         column_request: 컬럼 생성 요청 데이터
+        service: AI 서비스 (최초 요청 시 생성되어 재사용)
         
     Returns:
         ColumnResponse: 생성된 컬럼 데이터
@@ -130,56 +240,15 @@ async def generate_column(request: Request, column_request: ColumnRequest):
         logger.info(f"컬럼 생성 요청: {column_request.topic}")
         
         # 컬럼 생성 (뉴스 검색 기간 및 검색 모드 파라미터 추가)
-        article_content = await gemini_service.generate_column(
+        article_content = await service.generate_column(
             topic=column_request.topic,
             max_revision_attempts=column_request.maxRevisionAttempts,
             days_back=column_request.daysBack,
             search_mode=column_request.searchMode
         )
         
-        # 메타데이터 생성
-        word_count = len(article_content.content.replace(" ", ""))
-        created_date = datetime.utcnow().isoformat() + "Z"
-        
-        # 요약 길이 가드(<=300자). 초과 시 말줄임표 추가
-        safe_summary = article_content.summary
-        if isinstance(safe_summary, str) and len(safe_summary) > 300:
-            safe_summary = (safe_summary[:297]).rstrip() + "..."
-
-        # Source 모델 입력 정규화 (테스트에서 MagicMock을 반환해도 dict로 변환)
-        normalized_sources = None
-        if getattr(article_content, "sources", None):
-            normalized_sources = []
-            for s in article_content.sources:
-                try:
-                    if isinstance(s, dict):
-                        normalized_sources.append({
-                            "title": s.get("title", ""),
-                            "uri": s.get("uri", "")
-                        })
-                    else:
-                        title = getattr(s, "title", "")
-                        uri = getattr(s, "uri", "")
-                        normalized_sources.append({"title": title, "uri": uri})
-                except Exception:
-                    continue
-
         # 응답 데이터 구성
-        response = ColumnResponse(
-            success=True,
-            article=ArticleData(
-                title=article_content.title,
-                summary=safe_summary,
-                content=article_content.content,
-                metadata=MetaData(
-                    wordCount=word_count,
-                    category="정치",
-                    createdDate=created_date,
-                    sources=normalized_sources
-                )
-            ),
-            processedDate=created_date
-        )
+        response = _build_column_response(article_content, category="정치")
         
         logger.info(f"컬럼 생성 완료: {article_content.title}")
         return response
@@ -201,13 +270,18 @@ async def generate_column(request: Request, column_request: ColumnRequest):
 # 새로운 엔드포인트 추가: 뉴스 미리보기
 @app.post("/api/preview-news", response_model=NewsPreviewResponse)
 @limiter.limit("10/minute")  # 미리보기는 더 자주 허용
-async def preview_news(request: Request, column_request: ColumnRequest):
+async def preview_news(
+    request: Request,
+    column_request: ColumnRequest,
+    service: "GeminiService" = Depends(get_gemini_service)
+):
     """
     뉴스 검색 결과 미리보기 API 엔드포인트
     사용자가 컬럼 생성 전에 검색될 뉴스를 확인할 수 있습니다.
     
     Args:
         column_request: 컬럼 생성 요청 데이터
+        service: AI 서비스 (최초 요청 시 생성되어 재사용)
         
     Returns:
         NewsPreviewResponse: 뉴스 검색 결과 미리보기
@@ -216,7 +290,7 @@ async def preview_news(request: Request, column_request: ColumnRequest):
         logger.info(f"뉴스 미리보기 요청: {column_request.topic}")
         
         # 뉴스 검색만 실행 (컬럼 생성은 하지 않음, 검색 모드 포함)
-        news_data, sources = await gemini_service._search_latest_news(
+        news_data, sources = await service._search_latest_news(
             topic=column_request.topic, 
             days_back=column_request.daysBack,
             search_mode=column_request.searchMode
@@ -224,11 +298,8 @@ async def preview_news(request: Request, column_request: ColumnRequest):
         
         # 뉴스 데이터를 캐시에 저장 (확정 API에서 재사용하기 위해)
         cache_key = f"{column_request.topic}_{column_request.daysBack}_{column_request.searchMode}"
-        news_cache[cache_key] = {
-            "news_data": news_data,
-            "sources": sources,
-            "timestamp": datetime.utcnow()
-        }
+        with news_cache_lock:
+            news_cache[cache_key] = (news_data, sources)
         logger.info(f"뉴스 데이터 캐시 저장: {cache_key} (뉴스 {len(news_data)}개)")
         
         # 검색 품질 평가
@@ -246,17 +317,18 @@ async def preview_news(request: Request, column_request: ColumnRequest):
             quality = "poor"
             recommendation = "뉴스 데이터가 부족합니다. 다른 주제나 검색 기간으로 다시 시도해보세요."
         
-        # 미리보기용 뉴스 목록 (최대 5개)
-        preview_news = []
-        for item in news_data[:5]:
-            preview_news.append(NewsSearchResult(
+        # 미리보기용 뉴스 목록 (최대 5개) - 뉴스 서비스가 정제한 값이므로 검증 없이 생성
+        preview_news = [
+            NewsSearchResult.model_construct(
                 title=item.get('title', '제목 없음'),
                 description=item.get('description', '설명 없음'),
                 pubDate=item.get('pubDate', '날짜 없음'),
                 originalLink=item.get('originalLink')
-            ))
+            )
+            for item in news_data[:5]
+        ]
         
-        return NewsPreviewResponse(
+        return NewsPreviewResponse.model_construct(
             success=True,
             topic=column_request.topic,
             searchPeriod=column_request.daysBack,
@@ -265,7 +337,7 @@ async def preview_news(request: Request, column_request: ColumnRequest):
             totalAvailable=news_count,
             searchQuality=quality,
             recommendation=recommendation,
-            processedDate=datetime.utcnow().isoformat() + "Z"
+            processedDate=utc_now_iso()
         )
         
     except Exception as e:
@@ -276,15 +348,25 @@ async def preview_news(request: Request, column_request: ColumnRequest):
         )
 
 
-@app.post("/api/generate-column-confirmed", response_model=ColumnResponse)
+# generate-column과 같은 이유로 response_model 없이 반환
+@app.post(
+    "/api/generate-column-confirmed",
+    response_model=None,
+    responses={200: {"model": ColumnResponse}}
+)
 @limiter.limit("3/minute")  # 실제 컬럼 생성은 더 엄격한 제한
-async def generate_column_confirmed(request: Request, confirm_request: ColumnGenerationConfirmRequest):
+async def generate_column_confirmed(
+    request: Request,
+    confirm_request: ColumnGenerationConfirmRequest,
+    service: "GeminiService" = Depends(get_gemini_service)
+) -> ColumnResponse:
     """
     사용자 확인 후 컬럼 생성 API 엔드포인트
     뉴스 미리보기를 확인한 후 컬럼 생성을 진행합니다.
     
     Args:
         confirm_request: 컬럼 생성 확인 요청
+        service: AI 서비스 (최초 요청 시 생성되어 재사용)
         
     Returns:
         ColumnResponse: 생성된 컬럼 데이터 또는 중단 메시지
@@ -301,73 +383,34 @@ async def generate_column_confirmed(request: Request, confirm_request: ColumnGen
         
         # 캐시에서 기존 뉴스 데이터 확인 (재검색 방지)
         cache_key = f"{confirm_request.topic}_{confirm_request.daysBack}_{confirm_request.searchMode}"
-        cached_data = news_cache.get(cache_key)
+        with news_cache_lock:
+            cached_data = news_cache.get(cache_key)
         
         if cached_data:
             # 캐시된 뉴스 데이터로 컬럼 생성 (재검색 없음)
-            logger.info(f"캐시된 뉴스 데이터 사용: {cache_key} (뉴스 {len(cached_data['news_data'])}개)")
-            article_content = await gemini_service.generate_column_with_news(
+            cached_news, cached_sources = cached_data
+            logger.info(f"캐시된 뉴스 데이터 사용: {cache_key} (뉴스 {len(cached_news)}개)")
+            article_content = await service.generate_column_with_news(
                 topic=confirm_request.topic,
-                news_data=cached_data["news_data"],
-                sources=cached_data["sources"], 
+                news_data=cached_news,
+                sources=cached_sources, 
                 max_revision_attempts=confirm_request.maxRevisionAttempts
             )
-            # 사용된 캐시 데이터는 정리
-            del news_cache[cache_key]
+            # 사용된 캐시 데이터는 즉시 정리 (만료 전 메모리 회수)
+            with news_cache_lock:
+                news_cache.pop(cache_key, None)
         else:
             # 캐시 데이터가 없으면 일반 컬럼 생성 (재검색 수행)
             logger.warning(f"캐시 데이터가 없어 재검색 수행: {cache_key}")
-            article_content = await gemini_service.generate_column(
+            article_content = await service.generate_column(
                 topic=confirm_request.topic,
                 max_revision_attempts=confirm_request.maxRevisionAttempts,
                 days_back=confirm_request.daysBack,
                 search_mode=confirm_request.searchMode
             )
         
-        # 메타데이터 생성 (기존 로직과 동일)
-        word_count = len(article_content.content.replace(" ", ""))
-        created_date = datetime.utcnow().isoformat() + "Z"
-        
-        # 요약 길이 가드(<=300자). 초과 시 말줄임표 추가
-        safe_summary = article_content.summary
-        if isinstance(safe_summary, str) and len(safe_summary) > 300:
-            safe_summary = (safe_summary[:297]).rstrip() + "..."
-
-        # Source 모델 입력 정규화
-        normalized_sources = None
-        if getattr(article_content, "sources", None):
-            normalized_sources = []
-            for s in article_content.sources:
-                try:
-                    if isinstance(s, dict):
-                        normalized_sources.append({
-                            "title": s.get("title", ""),
-                            "uri": s.get("uri", "")
-                        })
-                    else:
-                        title = getattr(s, "title", "")
-                        uri = getattr(s, "uri", "")
-                        normalized_sources.append({"title": title, "uri": uri})
-                except Exception as e:
-                    logger.warning(f"Source 정규화 중 오류: {str(e)}")
-                    continue
-
         # 응답 생성
-        response = ColumnResponse(
-            success=True,
-            article=ArticleData(
-                title=article_content.title,
-                summary=safe_summary,
-                content=article_content.content,
-                metadata=MetaData(
-                    wordCount=word_count,
-                    category="정치 컬럼",
-                    createdDate=created_date,
-                    sources=normalized_sources
-                )
-            ),
-            processedDate=created_date
-        )
+        response = _build_column_response(article_content, category="정치 컬럼")
         
         logger.info(f"사용자 승인 후 컬럼 생성 완료: {confirm_request.topic}")
         return response
@@ -382,8 +425,11 @@ async def generate_column_confirmed(request: Request, confirm_request: ColumnGen
         )
 
 
-# AWS Lambda용 핸들러 (Mangum 어댑터)
-handler = Mangum(app, lifespan="off")
+# AWS Lambda용 핸들러 (Mangum 어댑터) - Lambda 런타임에서만 로드
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    from mangum import Mangum
+
+    handler = Mangum(app, lifespan="off")
 
 
 if __name__ == "__main__":
@@ -3,125 +3,197 @@
 요청 크기 제한, 입력 검증, 보안 헤더 등을 처리
 """
 
+import logging
 import time
-from typing import Callable
-from fastapi import Request, Response, HTTPException
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Iterable, Optional, Tuple
 
-from core.config import settings
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.config import get_settings
 from core.exceptions import ValidationException
+from core.utils import utc_now_iso
 from schemas import ErrorResponse
 
+logger = logging.getLogger(__name__)
+
+
+# 실행 환경은 프로세스 수명 동안 바뀌지 않으므로 import 시 1회만 판별
+_IS_PRODUCTION: bool = get_settings().is_production
+
+# 로드밸런서가 계속 호출하는 헬스 체크 경로 (모든 미들웨어 처리를 건너뜀)
+_HEALTH_CHECK_PATH = "/health"
+
+# 모든 응답에 붙는 정적 보안 헤더 (import 시 1회만 구성)
+_STATIC_SECURITY_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+}
+
+# 프로덕션 환경에서만 HSTS 헤더 추가
+if _IS_PRODUCTION:
+    _STATIC_SECURITY_HEADERS["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+
+# ASGI 응답 메시지에 그대로 덧붙일 수 있도록 (소문자 bytes 이름, bytes 값) 형태로 변환
+_SECURITY_HEADER_LIST: Tuple[Tuple[bytes, bytes], ...] = tuple(
+    (name.lower().encode("latin-1"), value.encode("latin-1"))
+    for name, value in _STATIC_SECURITY_HEADERS.items()
+)
+
 
-class SecurityMiddleware(BaseHTTPMiddleware):
-    """보안 미들웨어"""
+def _get_header(scope: Scope, name: bytes) -> Optional[bytes]:
+    """
+    ASGI scope의 원본 헤더 목록에서 헤더 값 조회
+
+    Args:
+        scope: ASGI scope
+        name: 소문자 bytes 헤더 이름
+
+    Returns:
+        Optional[bytes]: 헤더 값 (없으면 None)
+    """
+    headers: Iterable[Tuple[bytes, bytes]] = scope["headers"]
+    for key, value in headers:
+        if key == name:
+            return value
+    return None
+
+
+class SecurityMiddleware:
+    """보안 미들웨어 (순수 ASGI 구현)"""
     
-    def __init__(self, app, max_request_size: int = None):
-        super().__init__(app)
-        self.max_request_size = max_request_size or settings.max_request_size
+    def __init__(self, app: ASGIApp, max_request_size: Optional[int] = None) -> None:
+        self.app = app
+        self.max_request_size = max_request_size or get_settings().max_request_size
     
-    async def dispatch(self, request: Request, call_next: Callable):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """요청 처리 및 보안 검사"""
+        if scope["type"] != "http" or scope["path"] == _HEALTH_CHECK_PATH:
+            await self.app(scope, receive, send)
+            return
         
         # 1. 요청 크기 제한 검사
-        content_length = request.headers.get("content-length")
+        content_length = _get_header(scope, b"content-length")
         if content_length and int(content_length) > self.max_request_size:
-            return JSONResponse(
+            response = ORJSONResponse(
                 status_code=413,
                 content=ErrorResponse(
                     success=False,
                     error=f"요청 크기가 너무 큽니다. 최대 {self.max_request_size // 1024}KB까지 허용됩니다.",
-                    processedDate=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+                    processedDate=utc_now_iso()
                 ).model_dump()
             )
+            await response(scope, receive, send)
+            return
         
-        # 2. User-Agent 검사 (봇 차단)
-        user_agent = request.headers.get("user-agent", "").lower()
-        suspicious_agents = ["bot", "crawler", "spider", "scraper"]
-        if any(agent in user_agent for agent in suspicious_agents):
-            # 로깅만 하고 차단하지는 않음 (검색엔진 봇도 필요할 수 있음)
-            pass
-        
-        # 3. 요청 처리
-        response = await call_next(request)
-        
-        # 4. 보안 헤더 추가
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        
-        # 프로덕션 환경에서만 HSTS 헤더 추가
-        if settings.is_production:
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+        # 2. 요청 처리 + 3. 보안 헤더 추가 (응답 시작 메시지에 미리 구성한 헤더를 덧붙임)
+        # (봇 User-Agent는 검색엔진 봇도 필요할 수 있어 차단하지 않으므로 별도 검사하지 않음)
+        async def send_with_security_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *_SECURITY_HEADER_LIST]
+            await send(message)
         
-        return response
+        await self.app(scope, receive, send_with_security_headers)
 
 
-class InputSanitizationMiddleware(BaseHTTPMiddleware):
-    """입력 데이터 정화 미들웨어"""
+class InputSanitizationMiddleware:
+    """입력 데이터 정화 미들웨어 (순수 ASGI 구현)"""
     
-    async def dispatch(self, request: Request, call_next: Callable):
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """요청 데이터 정화"""
         
-        # POST 요청에 대한 추가 검증
-        if request.method == "POST":
-            # Content-Type 검사
-            content_type = request.headers.get("content-type", "")
-            if not content_type.startswith("application/json"):
-                return JSONResponse(
-                    status_code=400,
-                    content=ErrorResponse(
-                        success=False,
-                        error="Content-Type은 application/json이어야 합니다.",
-                        processedDate=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-                    ).model_dump()
-                )
+        # POST 이외의 요청은 헤더 조회 없이 바로 통과
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
         
-        return await call_next(request)
+        # Content-Type 검사 (ASGI가 소문자로 전달한 원본 헤더 bytes를 그대로 비교)
+        content_type = _get_header(scope, b"content-type") or b""
+        if not content_type.startswith(b"application/json"):
+            response = ORJSONResponse(
+                status_code=400,
+                content=ErrorResponse(
+                    success=False,
+                    error="Content-Type은 application/json이어야 합니다.",
+                    processedDate=utc_now_iso()
+                ).model_dump()
+            )
+            await response(scope, receive, send)
+            return
+        
+        await self.app(scope, receive, send)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """요청 로깅 미들웨어"""
+class RequestLoggingMiddleware:
+    """요청 로깅 미들웨어 (순수 ASGI 구현)"""
+    
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
     
-    async def dispatch(self, request: Request, call_next: Callable):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """요청/응답 로깅"""
-        start_time = time.time()
+        if scope["type"] != "http" or scope["path"] == _HEALTH_CHECK_PATH:
+            await self.app(scope, receive, send)
+            return
         
-        # 요청 정보 수집 (민감정보 제외)
-        request_info = {
-            "method": request.method,
-            "url": str(request.url.path),
-            "client_ip": self._get_client_ip(request),
-            "user_agent": request.headers.get("user-agent", "")[:200]  # 길이 제한
-        }
+        start_time = time.time()
+        status_code = 500
+        
+        async def send_with_process_time(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # 응답 헤더에 처리 시간 추가
+                process_time = time.time() - start_time
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-process-time", str(process_time).encode("latin-1"))
+                ]
+            await send(message)
         
         # 응답 처리
-        response = await call_next(request)
+        await self.app(scope, receive, send_with_process_time)
         
         # 처리 시간 계산
         process_time = time.time() - start_time
         
-        # 로그 출력 (프로덕션에서는 구조화된 로깅 사용 권장)
-        if settings.log_level == "DEBUG" or response.status_code >= 400:
-            print(f"{request_info['method']} {request_info['url']} - "
-                  f"Status: {response.status_code} - Time: {process_time:.3f}s")
+        # 로그 출력: 오류 응답은 항상, 그 외는 DEBUG 레벨이 켜진 경우에만 기록
+        if status_code >= 400:
+            log_level = logging.WARNING
+        elif logger.isEnabledFor(logging.DEBUG):
+            log_level = logging.DEBUG
+        else:
+            return
         
-        # 응답 헤더에 처리 시간 추가
-        response.headers["X-Process-Time"] = str(process_time)
-        
-        return response
+        # 요청 정보 수집 (민감정보 제외) - 실제로 로그를 남길 때만 구성
+        user_agent = _get_header(scope, b"user-agent") or b""
+        request_info = {
+            "method": scope["method"],
+            "url": scope["path"],
+            "client_ip": self._get_client_ip(scope),
+            "user_agent": user_agent.decode("latin-1")[:200]  # 길이 제한
+        }
+        logger.log(
+            log_level,
+            "%s %s - Status: %d - Time: %.3fs",
+            request_info["method"], request_info["url"], status_code, process_time,
+            extra={"request_info": request_info}
+        )
     
-    def _get_client_ip(self, request: Request) -> str:
+    def _get_client_ip(self, scope: Scope) -> str:
         """클라이언트 IP 주소 추출"""
         # 프록시 뒤에 있을 경우를 고려하여 헤더에서 IP 추출
-        forwarded_for = request.headers.get("x-forwarded-for")
+        forwarded_for = _get_header(scope, b"x-forwarded-for")
         if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
+            return forwarded_for.partition(b",")[0].strip().decode("latin-1")
         
-        real_ip = request.headers.get("x-real-ip")
+        real_ip = _get_header(scope, b"x-real-ip")
         if real_ip:
-            return real_ip
+            return real_ip.decode("latin-1")
         
-        return request.client.host if request.client else "unknown"
\ No newline at end of file
+        client = scope.get("client")
+        return client[0] if client else "unknown"
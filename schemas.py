@@ -3,12 +3,43 @@ Pydantic 모델 정의
 API 요청/응답 스키마 및 데이터 검증을 위한 모델들
 """
 
-from typing import List, Optional, Dict, Any
-from datetime import datetime
-from pydantic import BaseModel, Field, validator
+import re
+from typing import List, Optional, Dict
+from pydantic import BaseModel, ConfigDict, Field, validator
+from typing_extensions import TypedDict
 
+# 주제에 포함될 수 없는 금지 키워드 (보안상 민감한 내용 필터링)
+_FORBIDDEN_KEYWORDS = ("욕설", "혐오", "비방", "개인정보")
+# 키워드별 부분 문자열 검색 대신 한 번의 정규식 탐색으로 검사 (한글이라 대소문자 변환 불필요)
+_FORBIDDEN_RE = re.compile("|".join(map(re.escape, _FORBIDDEN_KEYWORDS)))
 
-class ColumnRequest(BaseModel):
+
+class _InternalModel(BaseModel):
+    """
+    서비스 내부/응답 조립용 모델의 공통 베이스
+    
+    중첩 모델 인스턴스를 다시 검증/복사하지 않고, 스키마 빌드는 첫 사용 시점으로 미룹니다.
+    """
+    
+    model_config = ConfigDict(
+        revalidate_instances="never",
+        validate_assignment=False,
+        defer_build=True,
+    )
+
+
+class _ApiModel(BaseModel):
+    """
+    API 요청/응답 모델의 공통 베이스
+    
+    스키마 빌드를 첫 사용 시점으로 미뤄 import 비용을 줄입니다.
+    (라우트에 연결된 모델은 FastAPI가 앱 생성 시 미리 빌드)
+    """
+    
+    model_config = ConfigDict(defer_build=True)
+
+
+class ColumnRequest(_ApiModel):
     """컬럼 생성 요청 스키마"""
     
     topic: str = Field(
@@ -39,36 +70,41 @@ class ColumnRequest(BaseModel):
     )
 
     @validator("topic")
-    def validate_topic(cls, v):
+    def validate_topic(cls, v: str) -> str:
         """주제 검증"""
         if not v.strip():
             raise ValueError("주제는 공백일 수 없습니다.")
         
         # 금지된 키워드 검사 (보안상 민감한 내용 필터링)
-        forbidden_keywords = ["욕설", "혐오", "비방", "개인정보"]
-        topic_lower = v.lower()
-        for keyword in forbidden_keywords:
-            if keyword in topic_lower:
-                raise ValueError(f"부적절한 내용이 포함되어 있습니다: {keyword}")
+        match = _FORBIDDEN_RE.search(v)
+        if match:
+            raise ValueError(f"부적절한 내용이 포함되어 있습니다: {match.group(0)}")
         
         return v.strip()
 
     @validator("searchMode")
-    def validate_search_mode(cls, v):
+    def validate_search_mode(cls, v: Optional[str]) -> Optional[str]:
         """검색 모드 검증"""
         if v not in ["title", "all"]:
             raise ValueError("searchMode는 'title' 또는 'all'만 허용됩니다.")
         return v
 
 
-class Source(BaseModel):
+class Source(_InternalModel):
     """참고 자료 스키마"""
     
     title: str = Field(..., description="자료 제목")
     uri: str = Field(..., description="자료 URL")
 
 
-class MetaData(BaseModel):
+class SourceDict(TypedDict):
+    """서비스 간에 주고받는 참고 자료 (검증/모델 생성 비용 없는 내부 표현)"""
+    
+    title: str
+    uri: str
+
+
+class MetaData(_InternalModel):
     """메타데이터 스키마"""
     
     wordCount: int = Field(..., ge=0, description="단어 수")
@@ -77,7 +113,7 @@ class MetaData(BaseModel):
     sources: Optional[List[Source]] = Field(default=None, description="참고 자료 목록")
 
 
-class ArticleData(BaseModel):
+class ArticleData(_ApiModel):
     """아티클 데이터 스키마"""
     
     title: str = Field(..., min_length=5, max_length=100, description="컬럼 제목")
@@ -86,7 +122,7 @@ class ArticleData(BaseModel):
     metadata: MetaData = Field(..., description="메타데이터")
 
 
-class ColumnResponse(BaseModel):
+class ColumnResponse(_ApiModel):
     """컬럼 생성 응답 스키마"""
     
     success: bool = Field(..., description="성공 여부")
@@ -94,7 +130,7 @@ class ColumnResponse(BaseModel):
     processedDate: str = Field(..., description="처리 완료 일시 (ISO 8601)")
 
 
-class NewsSearchResult(BaseModel):
+class NewsSearchResult(_ApiModel):
     """뉴스 검색 결과 스키마"""
     
     title: str = Field(..., description="뉴스 제목")
@@ -103,7 +139,7 @@ class NewsSearchResult(BaseModel):
     originalLink: Optional[str] = Field(default=None, description="원본 링크")
 
 
-class NewsPreviewResponse(BaseModel):
+class NewsPreviewResponse(_ApiModel):
     """뉴스 미리보기 응답 스키마"""
     
     success: bool = Field(..., description="성공 여부")
@@ -117,7 +153,7 @@ class NewsPreviewResponse(BaseModel):
     processedDate: str = Field(..., description="처리 일시 (ISO 8601)")
 
 
-class ColumnGenerationConfirmRequest(BaseModel):
+class ColumnGenerationConfirmRequest(_ApiModel):
     """컬럼 생성 확인 요청 스키마"""
     
     topic: str = Field(..., description="컬럼 주제")
@@ -127,7 +163,7 @@ class ColumnGenerationConfirmRequest(BaseModel):
     proceed: bool = Field(..., description="컬럼 생성 진행 여부")
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(_ApiModel):
     """에러 응답 스키마"""
     
     success: bool = Field(default=False, description="성공 여부")
@@ -137,7 +173,7 @@ class ErrorResponse(BaseModel):
 
 # 서비스 레이어에서 사용하는 내부 모델들
 
-class EvaluationResult(BaseModel):
+class EvaluationResult(_InternalModel):
     """컬럼 평가 결과 스키마"""
     
     scores: Dict[str, float] = Field(..., description="평가 점수")
@@ -146,16 +182,16 @@ class EvaluationResult(BaseModel):
     revisedContent: str = Field(..., description="수정된 컨텐츠")
 
 
-class GeneratedContent(BaseModel):
+class GeneratedContent(_InternalModel):
     """생성된 컨텐츠 스키마"""
     
     title: str = Field(..., description="제목")
     summary: str = Field(..., description="요약")
     content: str = Field(..., description="본문")
-    sources: Optional[List[Source]] = Field(default=None, description="참고 자료")
+    sources: Optional[List[SourceDict]] = Field(default=None, description="참고 자료")
     
     
-class ParsedColumn(BaseModel):
+class ParsedColumn(_InternalModel):
     """파싱된 컬럼 스키마 (기존 TypeScript 타입 호환)"""
     
     title: str
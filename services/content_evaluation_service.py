@@ -3,42 +3,131 @@
 생성된 정치 컬럼의 품질을 평가하고 수정하는 전용 모듈
 """
 
-import json
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any
-from openai import AsyncOpenAI
+from typing import Dict, Any, Optional, Tuple
+
+import orjson
+from cachetools import LRUCache
+from openai import APITimeoutError
+from openai.types.chat import ChatCompletionSystemMessageParam
+from openai.types.shared_params import ResponseFormatJSONSchema
+from pydantic import ValidationError
 
 from schemas import EvaluationResult
-from core.exceptions import GeminiAPIException, ContentGenerationException
-from .prompts import PromptGenerator
+from core.exceptions import GeminiAPIException, ContentGenerationException, EvaluationTimeoutException
+from .openai_client import OPENAI_TIMEOUT_SECONDS, get_openai_client
+from .prompts import get_prompt_generator
 
 logger = logging.getLogger(__name__)
 
+# 평가 요청 시스템 메시지 (호출마다 재생성하지 않도록 모듈 상수로 보관)
+_EVAL_SYSTEM_MSG: ChatCompletionSystemMessageParam = {
+    "role": "system",
+    "content": "당신은 콘텐츠 품질 관리 전문가입니다. 주어진 컬럼을 평가하고 JSON 형식으로 결과를 반환해주세요."
+}
+
+
+def summarize_scores(scores: Dict[str, float], threshold: float = 85.0) -> Tuple[float, float, str, bool]:
+    """
+    항목별 점수를 한 번만 순회하여 평균/최저 점수/최저 항목/전체 통과 여부 계산
+    
+    Args:
+        scores: 각 항목별 점수
+        threshold: 통과 기준 점수 (기본 85점)
+        
+    Returns:
+        Tuple[float, float, str, bool]: (평균 점수, 최저 점수, 최저 항목, 모든 항목 통과 여부)
+        점수가 없으면 (0.0, 0.0, "N/A", False)
+    """
+    if not scores:
+        return 0.0, 0.0, "N/A", False
+    
+    total = 0.0
+    min_key, min_val = "N/A", float("inf")
+    for key, value in scores.items():
+        total += value
+        if value < min_val:
+            min_key, min_val = key, value
+    # 최저 점수가 기준 이상이면 모든 항목이 통과 (항목별 비교 불필요)
+    return total / len(scores), min_val, min_key, min_val >= threshold
+
 
 class ContentEvaluationService:
     """컨텐츠 평가 전용 서비스 클래스"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache_size: int = 0):
         """
         컨텐츠 평가 서비스 초기화
         
         Args:
             api_key: OpenAI API 키
+            cache_size: 동일 컨텐츠 평가 결과 캐시 크기 (0이면 캐시 사용 안 함)
         """
         self.api_key = api_key
         
-        # OpenAI 클라이언트 초기화
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        # 평가 결과 캐시 (키: 컨텐츠 해시, 민감한 컨텐츠를 다룰 수 있어 설정으로만 활성화)
+        self._eval_cache: Optional["LRUCache[bytes, EvaluationResult]"] = (
+            LRUCache(maxsize=cache_size) if cache_size > 0 else None
+        )
+        # 진행 중인 동일 컨텐츠 평가 (캐시 사용 시 동시 요청을 하나의 API 호출로 합침)
+        self._eval_inflight: Dict[bytes, "asyncio.Task[EvaluationResult]"] = {}
+        
+        # OpenAI 클라이언트 (같은 API 키를 쓰는 서비스끼리 커넥션 풀 공유)
+        self.client = get_openai_client(self.api_key)
         
         # 평가용 모델 설정 (일관성을 위해 낮은 temperature)
         self.model = "gpt-4.1-mini"
         
-        self.prompt_generator = PromptGenerator()
+        self.prompt_generator = get_prompt_generator()
+        
+        # 평가 응답 형식: strict JSON 스키마로 필드/타입을 보장받아 응답을 바로 모델로 파싱
+        self.response_format: ResponseFormatJSONSchema = {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "column_evaluation",
+                "schema": self.prompt_generator.get_evaluation_schema(),
+                "strict": True
+            }
+        }
     
     async def evaluate_and_revise(self, content: str) -> EvaluationResult:
         """
         컨텐츠를 평가하고 필요시 수정
         
+        Args:
+            content: 평가할 컨텐츠
+            
+        Returns:
+            EvaluationResult: 평가 결과 및 수정된 컨텐츠
+        """
+        if self._eval_cache is None:
+            return await self._evaluate(content)
+        
+        # 같은 컨텐츠를 이미 평가했다면 API 호출 없이 캐시된 결과 반환
+        cache_key = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+        cached: Optional[EvaluationResult] = self._eval_cache.get(cache_key)
+        if cached is not None:
+            logger.info("캐시된 평가 결과 사용")
+            return cached
+        
+        # 같은 컨텐츠를 평가 중이면 그 결과를 함께 기다림 (재시도/모니터링 요청 중복 방지)
+        task = self._eval_inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._evaluate(content))
+            self._eval_inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._eval_inflight.pop(cache_key, None))
+        
+        # 한 요청이 취소되어도 같은 평가를 기다리는 다른 요청에는 영향이 없도록 shield
+        result = await asyncio.shield(task)
+        self._eval_cache[cache_key] = result
+        return result
+    
+    async def _evaluate(self, content: str) -> EvaluationResult:
+        """
+        OpenAI API를 호출하여 컨텐츠 평가 (캐시 없이)
+        
         Args:
             content: 평가할 컨텐츠
             
@@ -51,23 +140,17 @@ class ContentEvaluationService:
             # 평가 프롬프트 생성
             prompt = self.prompt_generator.get_revision_prompt(content)
             
-            # OpenAI API 호출하여 평가 수행 (JSON 모드)
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "당신은 콘텐츠 품질 관리 전문가입니다. 주어진 컬럼을 평가하고 JSON 형식으로 결과를 반환해주세요."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.3,  # 평가 일관성을 위해 낮은 temperature
-                max_completion_tokens=4000
-            )
+            # OpenAI API 호출하여 평가 수행 (JSON 스키마 모드)
+            # 클라이언트 재시도까지 포함한 전체 대기 시간도 같은 한도로 제한
+            async with asyncio.timeout(OPENAI_TIMEOUT_SECONDS):
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[_EVAL_SYSTEM_MSG, {"role": "user", "content": prompt}],
+                    response_format=self.response_format,
+                    temperature=0.3,  # 평가 일관성을 위해 낮은 temperature
+                    max_completion_tokens=4000,
+                    timeout=OPENAI_TIMEOUT_SECONDS
+                )
             
             if not response.choices or not response.choices[0].message.content:
                 raise ContentGenerationException("평가 API가 빈 응답을 반환했습니다.")
@@ -76,20 +159,31 @@ class ContentEvaluationService:
             raw_response = response.choices[0].message.content
             logger.debug(f"원본 평가 응답: {raw_response}")
             
-            evaluation_data = json.loads(raw_response)
-            logger.debug(f"파싱된 평가 데이터: {evaluation_data}")
-            
-            # EvaluationResult 객체 생성
-            result = self._parse_evaluation_result(evaluation_data)
+            try:
+                # 스키마를 따르는 응답은 pydantic-core JSON 파서로 한 번에 검증/생성
+                result = EvaluationResult.model_validate_json(raw_response)
+                logger.info(f"평가 결과 - 평균점수: {summarize_scores(result.scores)[0]:.1f}, 통과: {result.pass_}")
+            except ValidationError:
+                # 스키마와 다른 응답(구버전 키 이름 등)은 기존 방식으로 보정하여 생성
+                evaluation_data = orjson.loads(raw_response)
+                logger.debug(f"파싱된 평가 데이터: {evaluation_data}")
+                result = self._parse_evaluation_result(evaluation_data)
             
             logger.info(f"컨텐츠 평가 완료: 통과여부={result.pass_}")
             logger.debug(f"평가 점수: {result.scores}")
             
             return result
             
-        except json.JSONDecodeError as e:
+        except (TimeoutError, APITimeoutError):
+            # asyncio 한도와 클라이언트 timeout 중 먼저 만료된 쪽 모두 시간 초과로 집계
+            logger.error(f"평가 API 응답 시간 초과 ({OPENAI_TIMEOUT_SECONDS:.0f}초)")
+            raise EvaluationTimeoutException()
+        except orjson.JSONDecodeError as e:
             logger.error(f"평가 결과 JSON 파싱 실패: {str(e)}")
             raise ContentGenerationException(f"평가 결과 파싱 오류: {str(e)}")
+        except ContentGenerationException:
+            # 위에서 직접 발생시킨 예외는 메시지를 중복으로 감싸지 않고 그대로 전달
+            raise
         except Exception as e:
             logger.error(f"컨텐츠 평가 중 오류: {str(e)}")
             raise ContentGenerationException(f"평가 중 오류가 발생했습니다: {str(e)}")
@@ -111,31 +205,32 @@ class ContentEvaluationService:
             # OpenAI가 실제로 반환하는 키들을 체크
             logger.debug(f"받은 점수 키들: {list(scores_data.keys())}")
             
+            # LLM 응답 값은 문자열/정수일 수 있으므로 float로 직접 변환 (검증 없이 생성하기 위함)
             scores = {
-                "format": (
+                "format": float(
                     scores_data.get("format", 0) or
                     scores_data.get("Format Compliance", 0) or
                     scores_data.get("format_compliance", 0)
                 ),
-                "balance": (
+                "balance": float(
                     scores_data.get("balance", 0) or 
                     scores_data.get("Balance", 0) or
                     scores_data.get("Content Quality", 0) or  # API가 하나로 통합해서 반환하는 경우
                     0
                 ),
-                "readability": (
+                "readability": float(
                     scores_data.get("readability", 0) or
                     scores_data.get("Readability", 0) or
                     scores_data.get("Content Quality", 0) or  # API가 하나로 통합해서 반환하는 경우
                     0
                 ),
-                "completeness": (
+                "completeness": float(
                     scores_data.get("completeness", 0) or
                     scores_data.get("Completeness", 0) or
                     scores_data.get("Content Quality", 0) or  # API가 하나로 통합해서 반환하는 경우
                     0
                 ),
-                "objectivity": (
+                "objectivity": float(
                     scores_data.get("objectivity", 0) or
                     scores_data.get("Objectivity", 0) or
                     scores_data.get("Content Quality", 0) or  # API가 하나로 통합해서 반환하는 경우
@@ -144,35 +239,35 @@ class ContentEvaluationService:
             }
             
             # 통과 여부 확인
-            pass_status = evaluation_data.get("pass", False)
+            pass_status = bool(evaluation_data.get("pass", False))
             
             # 피드백 메시지
-            feedback = evaluation_data.get("feedback", "평가 완료")
+            feedback = str(evaluation_data.get("feedback", "평가 완료"))
             
             # 수정된 컨텐츠
-            revised_content = evaluation_data.get("revisedContent", "")
-            
-            # EvaluationResult 객체 생성 (alias 사용하여 딕셔너리로)
-            result_data = {
-                "scores": scores,
-                "pass": pass_status,  # alias 사용
-                "feedback": feedback,
-                "revisedContent": revised_content
-            }
-            result = EvaluationResult.model_validate(result_data)
+            revised_content = str(evaluation_data.get("revisedContent", ""))
             
-            # 평가 결과 로깅
-            total_score = sum(scores.values()) / len(scores) if scores else 0
-            logger.info(f"평가 결과 - 평균점수: {total_score:.1f}, 통과: {pass_status}")
-            
-            if not pass_status:
-                logger.warning(f"품질 기준 미달 - 피드백: {feedback[:100]}...")
-            
-            return result
-            
-        except Exception as e:
+        except (AttributeError, TypeError, ValueError) as e:
+            # 응답 구조가 dict가 아니거나 점수를 숫자로 변환할 수 없는 경우
             logger.error(f"평가 결과 파싱 중 오류: {str(e)}")
             raise ContentGenerationException(f"평가 결과 처리 실패: {str(e)}")
+        
+        # EvaluationResult 객체 생성 (타입을 이미 맞췄으므로 재검증 없이 구성)
+        result = EvaluationResult.model_construct(
+            scores=scores,
+            pass_=pass_status,
+            feedback=feedback,
+            revisedContent=revised_content
+        )
+        
+        # 평가 결과 로깅
+        total_score = summarize_scores(scores)[0]
+        logger.info(f"평가 결과 - 평균점수: {total_score:.1f}, 통과: {pass_status}")
+        
+        if not pass_status:
+            logger.warning("품질 기준 미달 - 피드백: %.100s...", feedback)
+        
+        return result
     
     async def get_quality_score(self, content: str) -> Dict[str, float]:
         """
@@ -189,10 +284,11 @@ class ContentEvaluationService:
             
             evaluation = await self.evaluate_and_revise(content)
             
-            logger.info(f"품질 점수 계산 완료: 평균 {sum(evaluation.scores.values()) / len(evaluation.scores):.1f}")
+            logger.info(f"품질 점수 계산 완료: 평균 {summarize_scores(evaluation.scores)[0]:.1f}")
             return evaluation.scores
             
-        except Exception as e:
+        except ContentGenerationException as e:
+            # evaluate_and_revise는 모든 실패를 ContentGenerationException으로 감싸서 전달
             logger.error(f"품질 점수 계산 실패: {str(e)}")
             # Fallback: 기본 점수 반환
             return {
@@ -213,50 +309,31 @@ class ContentEvaluationService:
         Returns:
             Dict[str, Any]: 전체 품질 지표
         """
-        try:
-            # 평균 점수 계산
-            average_score = sum(scores.values()) / len(scores) if scores else 0
-            
-            # 최저 점수 찾기
-            min_score = min(scores.values()) if scores else 0
-            min_category = min(scores.keys(), key=lambda k: scores[k]) if scores else "N/A"
-            
-            # 품질 등급 결정
-            if average_score >= 90:
-                grade = "우수"
-            elif average_score >= 80:
-                grade = "양호"
-            elif average_score >= 70:
-                grade = "보통"
-            else:
-                grade = "개선필요"
-            
-            # 통과 여부 (모든 항목이 85점 이상)
-            passing = all(score >= 85 for score in scores.values()) if scores else False
-            
-            quality_info = {
-                "averageScore": round(average_score, 1),
-                "grade": grade,
-                "passing": passing,
-                "weakestCategory": min_category,
-                "weakestScore": round(min_score, 1),
-                "detailedScores": scores
-            }
-            
-            logger.debug(f"품질 지표 계산 완료: {grade} ({average_score:.1f}점)")
-            
-            return quality_info
-            
-        except Exception as e:
-            logger.error(f"품질 지표 계산 실패: {str(e)}")
-            return {
-                "averageScore": 0.0,
-                "grade": "오류",
-                "passing": False,
-                "weakestCategory": "N/A",
-                "weakestScore": 0.0,
-                "detailedScores": {}
-            }
+        # 평균 점수 / 최저 점수 항목 / 통과 여부(모든 항목이 85점 이상)를 한 번에 계산
+        average_score, min_score, min_category, passing = summarize_scores(scores)
+        
+        # 품질 등급 결정
+        if average_score >= 90:
+            grade = "우수"
+        elif average_score >= 80:
+            grade = "양호"
+        elif average_score >= 70:
+            grade = "보통"
+        else:
+            grade = "개선필요"
+        
+        quality_info = {
+            "averageScore": round(average_score, 1),
+            "grade": grade,
+            "passing": passing,
+            "weakestCategory": min_category,
+            "weakestScore": round(min_score, 1),
+            "detailedScores": scores
+        }
+        
+        logger.debug(f"품질 지표 계산 완료: {grade} ({average_score:.1f}점)")
+        
+        return quality_info
     
     def is_content_acceptable(self, scores: Dict[str, float], threshold: float = 85.0) -> bool:
         """
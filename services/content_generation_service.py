@@ -3,16 +3,37 @@
 OpenAI gpt-4.1-mini API를 사용하여 정치 컬럼을 생성하는 전용 모듈
 """
 
+import asyncio
 import logging
 from typing import Dict, List, Any
-from openai import AsyncOpenAI
 
-from schemas import Source
+from openai import APITimeoutError
+from openai.types.chat import ChatCompletionSystemMessageParam
+
+from schemas import SourceDict
 from core.exceptions import GeminiAPIException, ContentGenerationException
-from .prompts import PromptGenerator
+from .openai_client import OPENAI_TIMEOUT_SECONDS, get_openai_client
+from .prompts import get_prompt_generator
 
 logger = logging.getLogger(__name__)
 
+# 컬럼 생성 시스템 메시지 (호출마다 재생성하지 않도록 모듈 상수로 보관)
+_GEN_SYSTEM_MSG: ChatCompletionSystemMessageParam = {
+    "role": "system",
+    "content": "당신은 전문 정치 저널리스트입니다. 제공된 뉴스 데이터를 바탕으로 균형잡힌 정치 컬럼을 작성해주세요."
+}
+
+# 제목으로 사용할 마크다운 헤딩 접두어
+_TITLE_PREFIX = "## "
+# 제목 후보에서 제외할 섹션 헤딩 (startswith에 튜플로 한 번에 전달)
+_EXCLUDED_HEADINGS = ("## 💬", "## 🧨", "## 📌")
+# 프롬프트에 넣을 최대 뉴스 수와 뉴스 1건의 포맷
+_MAX_PROMPT_NEWS = 10
+_NEWS_TEMPLATE = "[뉴스 {i}] {title}\n- 내용: {desc}\n- 발행일: {date}\n- 출처: {src}"
+# 제목/요약을 찾지 못했을 때 사용할 기본값
+_DEFAULT_TITLE = "정치 컬럼"
+_DEFAULT_SUMMARY = "정치 이슈에 대한 균형잡힌 분석입니다."
+
 
 class ContentGenerationService:
     """컨텐츠 생성 전용 서비스 클래스"""
@@ -26,13 +47,13 @@ class ContentGenerationService:
         """
         self.api_key = api_key
         
-        # OpenAI 클라이언트 초기화
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        # OpenAI 클라이언트 (같은 API 키를 쓰는 서비스끼리 커넥션 풀 공유)
+        self.client = get_openai_client(self.api_key)
         
         # 사용할 모델 설정
         self.model = "gpt-4.1-mini"
         
-        self.prompt_generator = PromptGenerator()
+        self.prompt_generator = get_prompt_generator()
     
     async def generate_column_from_news(
         self, 
@@ -49,51 +70,76 @@ class ContentGenerationService:
         Returns:
             str: 생성된 컬럼 텍스트
         """
+        candidates = await self.generate_column_candidates(topic, news_data, n=1)
+        return candidates[0]
+    
+    async def generate_column_candidates(
+        self, 
+        topic: str, 
+        news_data: List[Dict[str, Any]],
+        n: int = 1
+    ) -> List[str]:
+        """
+        뉴스 데이터를 기반으로 정치 컬럼 초안 후보를 한 번의 API 호출로 n개 생성
+        
+        Args:
+            topic: 컬럼 주제
+            news_data: 네이버 뉴스 검색 결과
+            n: 생성할 초안 후보 수 (OpenAI n 파라미터)
+            
+        Returns:
+            List[str]: 생성된 컬럼 텍스트 목록 (빈 응답 제외, 최소 1개)
+        """
         try:
-            logger.info(f"뉴스 기반 컬럼 생성 시작: {topic}")
+            logger.info(f"뉴스 기반 컬럼 생성 시작: {topic} (후보 {n}개)")
+            
+            # 프롬프트에는 최대 10개 뉴스만 사용 (한 번만 슬라이스하여 재사용)
+            top_news = news_data[:_MAX_PROMPT_NEWS]
             
             # 뉴스 데이터를 프롬프트용으로 포맷
-            news_summary = self._format_news_for_prompt(news_data)
+            news_summary = self._format_news_for_prompt(top_news)
             
             # 뉴스 소스 정보 추출
             news_sources = [{
                 'title': item.get('title', 'N/A'),
                 'url': item.get('originalLink', item.get('link', '#'))
-            } for item in news_data[:10]]
+            } for item in top_news]
             
             # 뉴스 기반 컬럼 생성 프롬프트 생성
             prompt = self.prompt_generator.get_draft_prompt_with_news(topic, news_summary, news_sources)
             
             # OpenAI API 호출하여 컬럼 생성
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "당신은 전문 정치 저널리스트입니다. 제공된 뉴스 데이터를 바탕으로 균형잡힌 정치 컬럼을 작성해주세요."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7,
-                max_completion_tokens=3000
-            )
-            
-            if not response.choices or not response.choices[0].message.content:
+            # 클라이언트 재시도까지 포함한 전체 대기 시간도 같은 한도로 제한
+            async with asyncio.timeout(OPENAI_TIMEOUT_SECONDS):
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[_GEN_SYSTEM_MSG, {"role": "user", "content": prompt}],
+                    temperature=0.7,
+                    max_completion_tokens=3000,
+                    n=n,
+                    timeout=OPENAI_TIMEOUT_SECONDS
+                )
+            
+            candidates = [choice.message.content for choice in response.choices if choice.message.content]
+            if not candidates:
                 raise ContentGenerationException("OpenAI API가 빈 응답을 반환했습니다.")
             
-            generated_text = response.choices[0].message.content
-            logger.info(f"뉴스 기반 컬럼 생성 완료: {len(generated_text)} 글자")
-            return generated_text
+            logger.info(f"뉴스 기반 컬럼 생성 완료: 후보 {len(candidates)}개, 첫 후보 {len(candidates[0])} 글자")
+            return candidates
             
+        except (TimeoutError, APITimeoutError):
+            # asyncio 한도와 클라이언트 timeout 중 먼저 만료된 쪽 모두 시간 초과로 처리
+            logger.error(f"컬럼 생성 API 응답 시간 초과 ({OPENAI_TIMEOUT_SECONDS:.0f}초)")
+            raise ContentGenerationException("컬럼 생성 API 응답 시간이 초과되었습니다.")
+        except ContentGenerationException:
+            # 위에서 직접 발생시킨 예외는 메시지를 중복으로 감싸지 않고 그대로 전달
+            raise
         except Exception as e:
             logger.error(f"뉴스 기반 컬럼 생성 실패: {str(e)}")
             raise ContentGenerationException(f"컬럼 생성 중 오류: {str(e)}")
     
     
-    async def generate_with_web_search(self, topic: str) -> tuple[str, List[Source]]:
+    async def generate_with_web_search(self, topic: str) -> tuple[str, List[SourceDict]]:
         """
         ⚠️ 이 함수는 더 이상 사용되지 않습니다.
         모든 컬럼 생성은 반드시 네이버 뉴스 데이터에 기반해야 합니다.
@@ -102,7 +148,7 @@ class ContentGenerationService:
             topic: 컬럼 주제
             
         Returns:
-            tuple[str, List[Source]]: 오류 발생
+            tuple[str, List[SourceDict]]: 오류 발생
         """
         logger.error(f"뉴스 데이터 없이 컬럼 생성 시도 거부됨: {topic}")
         raise ContentGenerationException(
@@ -115,7 +161,7 @@ class ContentGenerationService:
         뉴스 데이터를 프롬프트에 사용할 수 있는 형식으로 포맷
         
         Args:
-            news_data: 검색된 뉴스 데이터
+            news_data: 검색된 뉴스 데이터 (호출 측에서 최대 개수로 잘라서 전달)
             
         Returns:
             str: 프롬프트용으로 포맷된 뉴스 텍스트
@@ -123,18 +169,16 @@ class ContentGenerationService:
         if not news_data:
             return "관련 뉴스를 찾을 수 없습니다."
         
-        formatted_news = []
-        
-        for i, item in enumerate(news_data[:10], 1):  # 최대 10개만 사용
-            news_text = f"""
-                [뉴스 {i}] {item.get('title', 'N/A')}
-                - 내용: {item.get('description', 'N/A')}
-                - 발행일: {item.get('pubDate', 'N/A')}
-                - 출처: {item.get('originalLink', item.get('link', 'N/A'))}
-                """
-            formatted_news.append(news_text.strip())
-        
-        formatted_result = "\n\n".join(formatted_news)
+        formatted_result = "\n\n".join(
+            _NEWS_TEMPLATE.format(
+                i=i,
+                title=item.get('title', 'N/A'),
+                desc=item.get('description', 'N/A'),
+                date=item.get('pubDate', 'N/A'),
+                src=item.get('originalLink', item.get('link', 'N/A'))
+            )
+            for i, item in enumerate(news_data, 1)
+        )
         logger.debug(f"뉴스 프롬프트 포맷팅 완료: {len(news_data)}개 → {len(formatted_result)} 글자")
         
         return formatted_result
@@ -150,39 +194,26 @@ class ContentGenerationService:
         Returns:
             tuple[str, str]: 제목과 요약
         """
-        try:
-            logger.info("마크다운 컬럼에서 제목과 요약 추출 시작")
-            
-            lines = content.split('\n')
-            title = "정치 컬럼"
-            summary = "정치 이슈에 대한 균형잡힌 분석입니다."
-            
-            # 첫 번째 ## 헤딩을 제목으로 사용
-            for line in lines:
-                line = line.strip()
-                if line.startswith('## ') and not line.startswith('## 💬') and not line.startswith('## 🧨') and not line.startswith('## 📌'):
-                    title = line[3:].strip()  # '## ' 제거
-                    break
-            
-            # 제목 다음의 첫 번째 비어있지 않은 문단을 요약으로 사용
-            found_title = False
-            for line in lines:
-                line = line.strip()
-                if line.startswith('## ') and title in line:
+        logger.info("마크다운 컬럼에서 제목과 요약 추출 시작")
+        
+        title = _DEFAULT_TITLE
+        summary = _DEFAULT_SUMMARY
+        
+        # 한 번의 순회로 처리: 첫 번째 ## 헤딩을 제목으로, 그 다음의 첫 번째 비어있지 않은 문단을 요약으로 사용
+        found_title = False
+        for line in content.splitlines():
+            line = line.strip()
+            if not found_title:
+                if line.startswith(_TITLE_PREFIX) and not line.startswith(_EXCLUDED_HEADINGS):
+                    title = line[len(_TITLE_PREFIX):].strip()  # '## ' 제거
                     found_title = True
-                    continue
-                elif found_title and line and not line.startswith('#') and not line.startswith('## '):
-                    # 300자 이내로 강제 제한 (초과 시 297자 + 말줄임표, 최종 <= 300)
-                    if len(line) > 300:
-                        summary = (line[:297]).rstrip() + "..."
-                    else:
-                        summary = line
-                    break
-            
-            logger.info(f"제목/요약 추출 완료: {title}")
-            return title, summary
-            
-        except Exception as e:
-            logger.error(f"제목/요약 추출 실패: {str(e)}")
-            # Fallback: 기본값 반환
-            return "정치 컬럼", "정치 이슈에 대한 균형잡힌 분석입니다."
\ No newline at end of file
+            elif line and not line.startswith('#'):
+                # 300자 이내로 강제 제한 (초과 시 297자 + 말줄임표, 최종 <= 300)
+                if len(line) > 300:
+                    summary = (line[:297]).rstrip() + "..."
+                else:
+                    summary = line
+                break
+        
+        logger.info(f"제목/요약 추출 완료: {title}")
+        return title, summary
@@ -3,18 +3,48 @@
 네이버 뉴스 검색, 컨텐츠 생성, 품질 평가를 통합하여 관리하는 메인 서비스
 """
 
+import asyncio
 import logging
-from typing import Optional, Tuple, List, Dict, Any
-from datetime import datetime
+from bisect import bisect_right
+from typing import Optional, Tuple, List, Dict, Any, AsyncIterator
 
-from schemas import GeneratedContent, EvaluationResult, Source
-from core.exceptions import GeminiAPIException, ContentGenerationException, NewsSearchException
+from cachetools import TTLCache
+
+from schemas import GeneratedContent, EvaluationResult, SourceDict
+from core.exceptions import (
+    GeminiAPIException, ContentGenerationException, NewsSearchException, EvaluationTimeoutException
+)
+from core.utils import utc_now_iso
 from .news_search_service import NaverNewsSearchService
 from .content_generation_service import ContentGenerationService
-from .content_evaluation_service import ContentEvaluationService
+from .content_evaluation_service import ContentEvaluationService, summarize_scores
 
 logger = logging.getLogger(__name__)
 
+# 평가 항목별 한국어 이름 매핑 (품질 평가 로그용)
+_CRITERIA_NAMES = {
+    "format": "형식/구조",
+    "balance": "균형성",
+    "readability": "가독성",
+    "completeness": "완성도",
+    "objectivity": "객관성"
+}
+
+# 평가 API 시간 초과가 연속으로 이 횟수만큼 발생하면 수정 루프를 중단하고 현재 컨텐츠 사용
+_MAX_CONSECUTIVE_EVAL_TIMEOUTS = 2
+
+# 항목 점수 구간별 이모지 (100점 기준: <60, 60-69, 70-84, 85-89, >=90)
+_SCORE_THRESHOLDS = (60, 70, 85, 90)
+_SCORE_EMOJIS = ("🔴", "🟠", "🟡", "🟢", "🏆")
+# 평균 점수 구간별 등급 (<70, 70-79, 80-89, >=90)
+_GRADE_THRESHOLDS = (70, 80, 90)
+_GRADES = (("❌", "개선필요"), ("⚠️", "보통"), ("✅", "양호"), ("🏆", "우수"))
+
+# 뉴스 검색 캐시 키: (topic, days_back, search_mode)
+_NewsCacheKey = Tuple[str, int, str]
+# 진행 중인 컬럼 생성 키: (topic, days_back, search_mode, max_revision_attempts)
+_ColumnKey = Tuple[str, int, str, int]
+
 
 class GeminiService:
     """
@@ -29,7 +59,11 @@ class GeminiService:
         self, 
         openai_api_key: str,
         naver_client_id: Optional[str] = None,
-        naver_client_secret: Optional[str] = None
+        naver_client_secret: Optional[str] = None,
+        draft_candidates: int = 1,
+        evaluation_cache_size: int = 0,
+        news_cache_size: int = 0,
+        news_cache_ttl: float = 300.0
     ):
         """
         통합 서비스 초기화
@@ -38,12 +72,29 @@ class GeminiService:
             openai_api_key: OpenAI API 키
             naver_client_id: 네이버 API 클라이언트 ID (선택)
             naver_client_secret: 네이버 API 클라이언트 시크릿 (선택)
+            draft_candidates: 한 번에 생성해 동시에 평가할 초안 후보 수 (1이면 기존과 동일)
+            evaluation_cache_size: 동일 컨텐츠 평가 결과 캐시 크기 (0이면 비활성화)
+            news_cache_size: 뉴스 검색 결과 캐시 크기 (0이면 비활성화)
+            news_cache_ttl: 뉴스 검색 결과 캐시 유지 시간 (초)
         """
         self.openai_api_key = openai_api_key
+        self.draft_candidates = max(1, draft_candidates)
         
         # 서비스 인스턴스 초기화 (OpenAI API 키 사용)
         self.content_generator = ContentGenerationService(openai_api_key)
-        self.content_evaluator = ContentEvaluationService(openai_api_key)
+        self.content_evaluator = ContentEvaluationService(openai_api_key, cache_size=evaluation_cache_size)
+        
+        # 같은 조건의 반복 검색이 네이버 API를 다시 호출하지 않도록 결과를 짧게 캐시
+        # (단일 이벤트 루프에서만 접근하므로 별도 잠금 불필요)
+        self._news_cache: Optional["TTLCache[_NewsCacheKey, Tuple[List[dict], List[SourceDict]]]"] = (
+            TTLCache(maxsize=news_cache_size, ttl=news_cache_ttl) if news_cache_size > 0 else None
+        )
+        # 진행 중인 동일 검색 요청 (동시 요청을 하나의 API 호출로 합침)
+        self._news_inflight: Dict[_NewsCacheKey, "asyncio.Task[Tuple[List[dict], List[SourceDict]]]"] = {}
+        # 진행 중인 동일 조건 컬럼 생성 (동시 요청이 같은 결과를 함께 기다려 LLM 호출 중복 방지)
+        self._column_inflight: Dict[_ColumnKey, "asyncio.Task[GeneratedContent]"] = {}
+        # 컬럼 생성 태스크별 대기 중인 요청 수 (모든 요청이 떠나면 생성 취소)
+        self._column_waiters: Dict["asyncio.Task[GeneratedContent]", int] = {}
         
         # 네이버 뉴스 검색 서비스 (API 키가 있는 경우에만)
         self.news_searcher = None
@@ -72,6 +123,96 @@ class GeminiService:
         Returns:
             GeneratedContent: 생성된 컬럼 및 메타데이터
         """
+        # 같은 조건으로 이미 생성 중이면 새로 시작하지 않고 그 결과를 함께 사용
+        key = (topic, days_back, search_mode, max_revision_attempts)
+        task = self._column_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._generate_column(topic, max_revision_attempts, days_back, search_mode)
+            )
+            self._column_inflight[key] = task
+            task.add_done_callback(lambda t: self._on_column_task_done(key, t))
+        else:
+            logger.info(f"진행 중인 동일 컬럼 생성 결과 대기: {topic}")
+        
+        # 한 요청이 취소되어도 같은 생성을 기다리는 다른 요청에는 영향이 없도록 shield
+        self._column_waiters[task] = self._column_waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            # 마지막 대기 요청이 떠났는데 생성 중이면 결과를 받을 곳이 없으므로 API 호출 중단
+            remaining = self._column_waiters.pop(task) - 1
+            if remaining:
+                self._column_waiters[task] = remaining
+            elif not task.done():
+                logger.info(f"대기 중인 요청이 없어 컬럼 생성 취소: {topic}")
+                task.cancel()
+    
+    def _on_column_task_done(self, key: _ColumnKey, task: "asyncio.Task[GeneratedContent]") -> None:
+        """
+        컬럼 생성 태스크 완료 처리 (진행 중 목록에서 제거)
+        
+        Args:
+            key: 생성 조건 키
+            task: 완료된 생성 태스크
+        """
+        self._column_inflight.pop(key, None)
+        # 대기 요청이 모두 떠난 뒤 실패해도 "Task exception was never retrieved" 경고가 남지 않도록 예외 조회
+        if not task.cancelled():
+            task.exception()
+    
+    async def _generate_column(
+        self, 
+        topic: str, 
+        max_revision_attempts: int,
+        days_back: int,
+        search_mode: str
+    ) -> GeneratedContent:
+        """
+        스트리밍 파이프라인을 끝까지 실행하여 최종 컬럼만 반환
+        
+        Args:
+            topic: 컬럼 주제
+            max_revision_attempts: 최대 수정 시도 횟수
+            days_back: 뉴스 검색 기간 (일 단위)
+            search_mode: 검색 범위 ("title": 제목만, "all": 제목+내용)
+            
+        Returns:
+            GeneratedContent: 생성된 컬럼 및 메타데이터
+        """
+        result: Optional[GeneratedContent] = None
+        async for event in self.generate_column_streaming(topic, max_revision_attempts, days_back, search_mode):
+            if event["stage"] == "final":
+                result = event["result"]
+        if result is None:
+            raise ContentGenerationException("컬럼 생성 결과를 받지 못했습니다.")
+        return result
+    
+    async def generate_column_streaming(
+        self, 
+        topic: str, 
+        max_revision_attempts: int = 3,
+        days_back: int = 7,
+        search_mode: str = "title"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        3단계 프로세스로 컬럼을 생성하면서 단계별 진행 상황을 순서대로 전달
+        
+        전달되는 이벤트 (stage 키로 구분):
+            {"stage": "news_done", "sources": [...]}
+            {"stage": "draft", "content": str}
+            {"stage": "eval", "attempt": int, "scores": {...}, "pass": bool}
+            {"stage": "final", "result": GeneratedContent}
+        
+        Args:
+            topic: 컬럼 주제
+            max_revision_attempts: 최대 수정 시도 횟수
+            days_back: 뉴스 검색 기간 (일 단위)
+            search_mode: 검색 범위 ("title": 제목만, "all": 제목+내용)
+            
+        Returns:
+            AsyncIterator[Dict[str, Any]]: 단계별 진행 이벤트
+        """
         try:
             logger.info(f"3단계 컬럼 생성 시작: {topic} (최대 수정 {max_revision_attempts}회)")
             
@@ -82,47 +223,20 @@ class GeminiService:
             
             # ✍️ 2단계: 수집된 뉴스를 바탕으로 컬럼 생성
             logger.info("2단계: 수집된 뉴스 기반 컬럼 생성 시작")
-            if news_data:
-                current_content = await self.content_generator.generate_column_from_news(topic, news_data)
-            else:
+            if not news_data:
                 # 뉴스 데이터가 없으면 컬럼 생성 불가
                 logger.error("뉴스 데이터가 없어 컬럼 생성 불가")
                 raise ContentGenerationException(
                     f"'{topic}' 관련 뉴스를 찾을 수 없어 팩트 기반 컬럼을 생성할 수 없습니다. "
                     "네이버 뉴스 API 설정을 확인해주세요."
                 )
-                
-            logger.info("컬럼 초안 생성 완료")
-            
-            # 📝 3단계: 반복적 품질 평가 및 수정
-            logger.info("3단계: 컬럼 품질 평가 및 수정 시작")
-            for attempt in range(max_revision_attempts):
-                logger.info(f"품질 평가 시도 {attempt + 1}/{max_revision_attempts}")
-                
-                evaluation = await self.content_evaluator.evaluate_and_revise(current_content)
-                
-                # 품질 평가 결과 로그 출력
-                self._log_quality_evaluation(evaluation, attempt + 1)
-                
-                if evaluation.pass_:
-                    logger.info("품질 기준 통과. 컬럼 생성 완료")
-                    break
-                
-                current_content = evaluation.revisedContent
-                logger.info(f"수정 완료. 피드백: {evaluation.feedback[:100]}...")
+            yield {"stage": "news_done", "sources": sources}
             
-            # 📄 4단계: 제목과 요약 추출
-            title, summary = await self.content_generator.extract_title_and_summary(current_content)
-            
-            result = GeneratedContent(
-                title=title,
-                summary=summary,
-                content=current_content,
-                sources=sources
-            )
+            # 📝 3단계: 반복적 품질 평가 및 수정 + 📄 4단계: 제목과 요약 추출
+            async for event in self._column_events(topic, news_data, sources, max_revision_attempts):
+                yield event
             
             logger.info("3단계 컬럼 생성 프로세스 완료")
-            return result
             
         except (GeminiAPIException, ContentGenerationException, NewsSearchException):
             raise
@@ -130,12 +244,60 @@ class GeminiService:
             logger.error(f"컬럼 생성 중 예상치 못한 오류: {str(e)}")
             raise ContentGenerationException(f"컬럼 생성 중 오류가 발생했습니다: {str(e)}")
     
+    async def generate_columns_batch(
+        self,
+        topics: List[str],
+        max_concurrency: int = 10,
+        rpm: int = 500,
+        max_revision_attempts: int = 3,
+        days_back: int = 7,
+        search_mode: str = "title"
+    ) -> List[GeneratedContent | BaseException]:
+        """
+        여러 주제의 컬럼을 동시에 생성 (동시 실행 수 및 분당 시작 횟수 제한)
+        
+        Args:
+            topics: 컬럼 주제 목록
+            max_concurrency: 동시에 진행할 최대 컬럼 생성 수
+            rpm: 분당 시작할 수 있는 최대 컬럼 생성 수
+            max_revision_attempts: 최대 수정 시도 횟수
+            days_back: 뉴스 검색 기간 (일 단위)
+            search_mode: 검색 범위 ("title": 제목만, "all": 제목+내용)
+            
+        Returns:
+            List[GeneratedContent | BaseException]: 주제 순서대로 생성 결과 또는 발생한 예외
+        """
+        logger.info(f"일괄 컬럼 생성 시작: {len(topics)}개 주제 (동시 {max_concurrency}개, 분당 {rpm}회)")
+        
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        start_lock = asyncio.Lock()
+        start_interval = 60.0 / max(1, rpm)
+        loop = asyncio.get_running_loop()
+        next_start = loop.time()
+        
+        async def _run(topic: str) -> GeneratedContent:
+            nonlocal next_start
+            async with semaphore:
+                # 시작 시각을 일정 간격으로 벌려 분당 호출 한도를 넘지 않도록 조절
+                async with start_lock:
+                    delay = next_start - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    next_start = max(next_start, loop.time()) + start_interval
+                return await self.generate_column(topic, max_revision_attempts, days_back, search_mode)
+        
+        results = await asyncio.gather(*(_run(topic) for topic in topics), return_exceptions=True)
+        
+        failed = sum(isinstance(result, BaseException) for result in results)
+        logger.info(f"일괄 컬럼 생성 완료: 성공 {len(results) - failed}개, 실패 {failed}개")
+        return results
+    
     async def _search_latest_news(
         self, 
         topic: str, 
         days_back: int = 7, 
         search_mode: str = "title"
-    ) -> Tuple[List[dict], List[Source]]:
+    ) -> Tuple[List[dict], List[SourceDict]]:
         """
         1단계: 주제 관련 최신 뉴스 검색
         
@@ -145,12 +307,54 @@ class GeminiService:
             search_mode: 검색 범위 ("title": 제목만, "all": 제목+내용)
             
         Returns:
-            Tuple[List[dict], List[Source]]: 뉴스 데이터와 소스 목록
+            Tuple[List[dict], List[SourceDict]]: 뉴스 데이터와 소스 목록
         """
         if not self.news_searcher:
             logger.warning("네이버 뉴스 검색 서비스가 비활성화되어 빈 결과 반환")
             return [], []
         
+        if self._news_cache is None:
+            return await self._fetch_latest_news(topic, days_back, search_mode)
+        
+        key = (topic, days_back, search_mode)
+        cached: Optional[Tuple[List[dict], List[SourceDict]]] = self._news_cache.get(key)
+        if cached is not None:
+            logger.info(f"캐시된 뉴스 검색 결과 사용: {topic} (뉴스 {len(cached[0])}개)")
+            return cached
+        
+        task = self._news_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_latest_news(topic, days_back, search_mode))
+            self._news_inflight[key] = task
+            task.add_done_callback(lambda _: self._news_inflight.pop(key, None))
+        
+        # 한 요청이 취소되어도 같은 검색을 기다리는 다른 요청에는 영향이 없도록 shield
+        result = await asyncio.shield(task)
+        # 검색 실패 시의 빈 결과는 캐시하지 않음
+        if result[0]:
+            self._news_cache[key] = result
+        return result
+    
+    async def _fetch_latest_news(
+        self, 
+        topic: str, 
+        days_back: int, 
+        search_mode: str
+    ) -> Tuple[List[dict], List[SourceDict]]:
+        """
+        네이버 뉴스 API를 호출하여 뉴스 검색 (캐시 없이)
+        
+        Args:
+            topic: 검색할 주제
+            days_back: 뉴스 검색 기간 (일 단위)
+            search_mode: 검색 범위 ("title": 제목만, "all": 제목+내용)
+            
+        Returns:
+            Tuple[List[dict], List[SourceDict]]: 뉴스 데이터와 소스 목록
+        """
+        if not self.news_searcher:
+            return [], []
+        
         try:
             logger.info(f"주제 '{topic}'에 대한 네이버 뉴스 검색 시작")
             
@@ -163,7 +367,7 @@ class GeminiService:
                 search_mode=search_mode # 검색 범위 (title/all)
             )
             
-            # Source 객체로 변환
+            # 참고 자료 목록으로 변환
             sources = self.news_searcher.convert_to_sources(news_data)
             
             logger.info(f"뉴스 검색 완료: {len(news_data)}개 뉴스, {len(sources)}개 소스")
@@ -174,7 +378,7 @@ class GeminiService:
             # Fallback: 빈 결과 반환
             return [], []
     
-    async def generate_draft_ts_style(self, topic: str) -> Tuple[str, List[Source]]:
+    async def generate_draft_ts_style(self, topic: str) -> Tuple[str, List[SourceDict]]:
         """
         TypeScript 스타일 호환성을 위한 간단한 컬럼 생성 메서드
         
@@ -182,7 +386,7 @@ class GeminiService:
             topic: 컬럼 주제
             
         Returns:
-            Tuple[str, List[Source]]: 생성된 텍스트와 소스 목록
+            Tuple[str, List[SourceDict]]: 생성된 텍스트와 소스 목록
         """
         try:
             logger.info(f"TypeScript 호환 모드로 컬럼 생성: {topic}")
@@ -215,7 +419,7 @@ class GeminiService:
         self, 
         topic: str,
         news_data: List[dict],
-        sources: List[Source],
+        sources: List[SourceDict],
         max_revision_attempts: int = 3
     ) -> GeneratedContent:
         """
@@ -224,7 +428,7 @@ class GeminiService:
         Args:
             topic: 컬럼 주제
             news_data: 이미 검색된 뉴스 데이터
-            sources: 이미 변환된 Source 객체 리스트
+            sources: 이미 변환된 참고 자료 리스트
             max_revision_attempts: 최대 수정 시도 횟수
             
         Returns:
@@ -239,46 +443,229 @@ class GeminiService:
                     f"'{topic}' 관련 뉴스 데이터가 없어 컬럼을 생성할 수 없습니다."
                 )
             
-            # ✍️ 1단계: 수집된 뉴스를 바탕으로 컬럼 생성
+            # ✍️ 1단계: 컬럼 생성 + 📝 2단계: 반복적 품질 평가 및 수정 + 📄 3단계: 제목과 요약 추출
+            # (이미 변환된 sources 사용)
             logger.info(f"기존 뉴스 데이터 기반 컬럼 생성 중 (뉴스 {len(news_data)}개)")
-            current_content = await self.content_generator.generate_column_from_news(topic, news_data)
-            logger.info("컬럼 초안 생성 완료")
+            result: Optional[GeneratedContent] = None
+            async for event in self._column_events(topic, news_data, sources, max_revision_attempts):
+                if event["stage"] == "final":
+                    result = event["result"]
+            if result is None:
+                raise ContentGenerationException("컬럼 생성 결과를 받지 못했습니다.")
+            
+            logger.info("기존 뉴스 데이터 기반 컬럼 생성 완료")
+            return result
+            
+        except (GeminiAPIException, ContentGenerationException):
+            raise
+        except Exception as e:
+            logger.error(f"기존 뉴스 기반 컬럼 생성 중 예상치 못한 오류: {str(e)}")
+            raise ContentGenerationException(f"컬럼 생성 중 오류가 발생했습니다: {str(e)}")
+    
+    async def _column_events(
+        self,
+        topic: str,
+        news_data: List[dict],
+        sources: List[SourceDict],
+        max_revision_attempts: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        검색된 뉴스로 초안 생성, 평가/수정, 제목/요약 추출까지 실행 (두 생성 경로 공통)
+        
+        Args:
+            topic: 컬럼 주제
+            news_data: 검색된 뉴스 데이터
+            sources: 변환된 참고 자료 리스트
+            max_revision_attempts: 최대 수정 시도 횟수
+            
+        Returns:
+            AsyncIterator[Dict[str, Any]]: "draft", "eval" 이벤트와 마지막 "final" 이벤트(GeneratedContent)
+        """
+        current_content = ""
+        async for event in self._draft_and_revise_events(topic, news_data, max_revision_attempts):
+            if event["stage"] == "revised":
+                current_content = event["content"]
+            else:
+                yield event
+        
+        # 제목과 요약 추출 (API 호출 없는 로컬 파싱이라 별도 태스크로 겹치지 않음)
+        title, summary = await self.content_generator.extract_title_and_summary(current_content)
+        
+        # 내부에서 만든 값이므로 검증 없이 구성
+        result = GeneratedContent.model_construct(
+            title=title,
+            summary=summary,
+            content=current_content,
+            sources=sources
+        )
+        yield {"stage": "final", "result": result}
+    
+    async def _draft_and_revise_events(
+        self,
+        topic: str,
+        news_data: List[dict],
+        max_revision_attempts: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        초안 생성 후 품질 기준을 통과할 때까지 평가/수정 반복 (진행 이벤트 전달)
+        
+        초안 후보가 여러 개로 설정된 경우 후보를 한 번에 생성하고 첫 평가를
+        동시에 수행하여, 가장 좋은 후보와 그 평가 결과로 수정 루프를 시작합니다.
+        평가 API가 연속으로 시간 초과되면 더 기다리지 않고 마지막 컨텐츠를 반환합니다.
+        
+        Args:
+            topic: 컬럼 주제
+            news_data: 검색된 뉴스 데이터
+            max_revision_attempts: 최대 수정 시도 횟수
             
-            # 📝 2단계: 반복적 품질 평가 및 수정
-            logger.info("컬럼 품질 평가 및 수정 시작")
+        Returns:
+            AsyncIterator[Dict[str, Any]]: "draft", "eval" 이벤트와 마지막 "revised" 이벤트(최종 본문)
+        """
+        evaluation: Optional[EvaluationResult] = None
+        if self.draft_candidates > 1 and max_revision_attempts > 0:
+            current_content, evaluation = await self._draft_best_candidate(topic, news_data)
+        else:
+            current_content = await self.content_generator.generate_column_from_news(topic, news_data)
+        logger.info("컬럼 초안 생성 완료")
+        yield {"stage": "draft", "content": current_content}
+        
+        logger.info("컬럼 품질 평가 및 수정 시작")
+        # 미통과 시 다음 평가를 미리 시작해 둔 태스크 (로그 처리 등과 API 대기 시간을 겹치게 함)
+        next_evaluation: Optional["asyncio.Task[EvaluationResult]"] = None
+        # 반복마다 속성 조회를 다시 하지 않도록 루프 전에 메서드를 지역 변수로 바인딩
+        evaluate = self.content_evaluator.evaluate_and_revise
+        log_evaluation = self._log_quality_evaluation
+        try:
             for attempt in range(max_revision_attempts):
                 logger.info(f"품질 평가 시도 {attempt + 1}/{max_revision_attempts}")
                 
-                evaluation = await self.content_evaluator.evaluate_and_revise(current_content)
+                # 후보 선정 과정에서 이미 평가했거나 미리 시작한 평가가 있으면 그 결과를 사용
+                if evaluation is None:
+                    evaluation = await self._evaluate_with_retry(current_content, next_evaluation)
+                    if evaluation is None:
+                        # 평가 API가 연속으로 시간 초과되어 현재 컨텐츠로 종료
+                        break
+                
+                # 미통과이고 시도가 남아 있으면 수정본 평가를 즉시 예약
+                next_evaluation = None
+                if not evaluation.pass_ and attempt + 1 < max_revision_attempts:
+                    next_evaluation = asyncio.create_task(evaluate(evaluation.revisedContent))
                 
                 # 품질 평가 결과 로그 출력
-                self._log_quality_evaluation(evaluation, attempt + 1)
+                log_evaluation(evaluation, attempt + 1)
+                yield {
+                    "stage": "eval",
+                    "attempt": attempt + 1,
+                    "scores": evaluation.scores,
+                    "pass": evaluation.pass_
+                }
                 
                 if evaluation.pass_:
                     logger.info("품질 기준 통과. 컬럼 생성 완료")
                     break
                 
                 current_content = evaluation.revisedContent
-                logger.info(f"수정 완료. 피드백: {evaluation.feedback[:100]}...")
-            
-            # 📄 3단계: 제목과 요약 추출
-            title, summary = await self.content_generator.extract_title_and_summary(current_content)
+                # %.100s: 로그가 실제로 출력될 때만 앞 100자를 잘라 포맷 (슬라이스 복사 없음)
+                logger.info("수정 완료. 피드백: %.100s...", evaluation.feedback)
+                evaluation = None
+        finally:
+            # 예외나 스트림 조기 종료로 루프를 빠져나온 경우 미리 시작한 평가 정리
+            if next_evaluation is not None and not next_evaluation.done():
+                next_evaluation.cancel()
+        
+        yield {"stage": "revised", "content": current_content}
+    
+    async def _evaluate_with_retry(
+        self,
+        content: str,
+        pending: Optional["asyncio.Task[EvaluationResult]"] = None
+    ) -> Optional[EvaluationResult]:
+        """
+        컨텐츠 평가 (시간 초과 시 같은 컨텐츠로 재시도)
+        
+        미리 시작한 평가 태스크가 있으면 첫 시도에서 그 결과를 기다립니다.
+        
+        Args:
+            content: 평가할 컨텐츠
+            pending: 미리 시작한 같은 컨텐츠의 평가 태스크
             
-            result = GeneratedContent(
-                title=title,
-                summary=summary,
-                content=current_content,
-                sources=sources  # 이미 변환된 sources 사용
-            )
+        Returns:
+            Optional[EvaluationResult]: 평가 결과 (연속 시간 초과 한도에 도달하면 None)
+        """
+        for timeouts in range(1, _MAX_CONSECUTIVE_EVAL_TIMEOUTS + 1):
+            try:
+                if pending is not None:
+                    return await pending
+                return await self.content_evaluator.evaluate_and_revise(content)
+            except EvaluationTimeoutException:
+                pending = None
+                if timeouts < _MAX_CONSECUTIVE_EVAL_TIMEOUTS:
+                    logger.warning("평가 API 시간 초과. 같은 컨텐츠로 다시 평가")
+        
+        logger.warning(f"평가 API 시간 초과 {_MAX_CONSECUTIVE_EVAL_TIMEOUTS}회 연속. 현재 컨텐츠로 수정 중단")
+        return None
+    
+    async def _draft_best_candidate(
+        self,
+        topic: str,
+        news_data: List[dict]
+    ) -> Tuple[str, Optional[EvaluationResult]]:
+        """
+        초안 후보를 한 번에 생성하고 동시에 평가하여 가장 좋은 후보 선택
+        
+        평가 시간이 초과된 후보는 제외하며, 모든 후보의 평가가 시간 초과되면
+        첫 번째 후보를 평가 결과 없이 반환해 수정 루프에서 다시 평가하도록 합니다.
+        
+        Args:
+            topic: 컬럼 주제
+            news_data: 검색된 뉴스 데이터
             
-            logger.info("기존 뉴스 데이터 기반 컬럼 생성 완료")
-            return result
+        Returns:
+            Tuple[str, Optional[EvaluationResult]]: 선택된 초안과 그 평가 결과 (평가 실패 시 None)
+        """
+        candidates = await self.content_generator.generate_column_candidates(
+            topic, news_data, n=self.draft_candidates
+        )
+        # 후보별 평가 API 호출을 동시에 실행하여 대기 시간을 한 번으로 줄임
+        # (TaskGroup: 시간 초과 외의 오류가 나면 나머지 평가를 즉시 취소)
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(self._evaluate_candidate(c)) for c in candidates]
+        except ExceptionGroup as eg:
+            # 기존 예외 처리 흐름(ContentGenerationException 등)을 유지하도록 첫 번째 원인 예외를 전달
+            raise eg.exceptions[0]
+        evaluated: List[Tuple[str, EvaluationResult]] = []
+        for candidate, task in zip(candidates, tasks):
+            evaluation = task.result()
+            if evaluation is not None:
+                evaluated.append((candidate, evaluation))
+        if not evaluated:
+            logger.warning("모든 초안 후보의 평가 시간이 초과되어 첫 번째 후보로 진행")
+            return candidates[0], None
+        
+        # 통과한 후보 우선, 그다음 평균 점수가 높은 후보 선택
+        best_content, best_evaluation = max(
+            evaluated,
+            key=lambda pair: (pair[1].pass_, summarize_scores(pair[1].scores)[0])
+        )
+        logger.info(f"평가된 초안 후보 {len(evaluated)}/{len(candidates)}개 중 최고점 후보 선택")
+        return best_content, best_evaluation
+    
+    async def _evaluate_candidate(self, content: str) -> Optional[EvaluationResult]:
+        """
+        초안 후보 평가 (시간 초과 시 None 반환)
+        
+        Args:
+            content: 평가할 초안 후보
             
-        except (GeminiAPIException, ContentGenerationException):
-            raise
-        except Exception as e:
-            logger.error(f"기존 뉴스 기반 컬럼 생성 중 예상치 못한 오류: {str(e)}")
-            raise ContentGenerationException(f"컬럼 생성 중 오류가 발생했습니다: {str(e)}")
+        Returns:
+            Optional[EvaluationResult]: 평가 결과 (시간 초과 시 None)
+        """
+        try:
+            return await self.content_evaluator.evaluate_and_revise(content)
+        except EvaluationTimeoutException:
+            logger.warning("초안 후보 평가 시간 초과. 해당 후보 제외")
+            return None
     
     async def evaluate_and_revise(self, content: str) -> EvaluationResult:
         """
@@ -329,7 +716,7 @@ class GeminiService:
             "content_generation": True,
             "content_evaluation": True,
             "news_search": self.news_searcher is not None,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": utc_now_iso()
         }
         
         logger.info(f"서비스 상태 확인: 뉴스검색={'활성' if status['news_search'] else '비활성'}")
@@ -337,86 +724,101 @@ class GeminiService:
     
     def _log_quality_evaluation(self, evaluation: EvaluationResult, attempt_number: int) -> None:
         """
-        품질 평가 결과를 종료 로그에 출력 (실제 평가 기준에 맞춤)
+        품질 평가 결과를 로그에 출력 (실제 평가 기준에 맞춤)
+        
+        INFO에서는 요약 한 줄과 구조화 필드(extra["quality_evaluation"])만 남기고,
+        항목별 이모지가 포함된 상세 보고서는 DEBUG가 활성화된 경우에만 만듭니다.
         
         Args:
             evaluation: 품질 평가 결과
             attempt_number: 현재 시도 횟수
         """
-        logger.info(f"📊 품질 평가 결과 - {attempt_number}차 시도")
-        logger.info("=" * 50)
+        if not logger.isEnabledFor(logging.INFO):
+            return
         
-        # 평가 항목별 한국어 이름 매핑
-        criteria_names = {
-            "format": "형식/구조",
-            "balance": "균형성",
-            "readability": "가독성", 
-            "completeness": "완성도",
-            "objectivity": "객관성"
-        }
+        # 평균/최저 점수 및 통과 여부 (모든 항목 85점 이상이어야 통과)를 한 번에 계산
+        passing_threshold = 85.0
+        avg_score, min_score, min_criteria, all_passing = summarize_scores(evaluation.scores, passing_threshold)
+        passed = evaluation.pass_ and all_passing
+        pass_status = "통과" if passed else "재작업 필요"
+        criteria_name = _CRITERIA_NAMES.get
         
-        # 개별 점수 출력 (0-100점 기준)
-        total_score = 0
-        score_count = 0
+        # 피드백 미리보기 (150글자로 제한)
+        feedback = evaluation.feedback
+        feedback_preview = feedback[:150] + "..." if len(feedback) > 150 else feedback
         
-        for criteria, score in evaluation.scores.items():
-            criteria_name = criteria_names.get(criteria, criteria)
-            
-            # 점수에 따른 이모지 선택 (100점 기준)
-            if score >= 90:
-                emoji = "🏆"
-            elif score >= 85:
-                emoji = "🟢"
-            elif score >= 70:
-                emoji = "🟡" 
-            elif score >= 60:
-                emoji = "🟠"
-            else:
-                emoji = "🔴"
-            
-            logger.info(f"{emoji} {criteria_name}: {score:.1f}/100.0")
-            total_score += score
-            score_count += 1
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(self._format_quality_report(
+                evaluation, attempt_number, passing_threshold,
+                avg_score, min_score, min_criteria, passed, feedback_preview
+            ))
+        
+        logger.info(
+            f"📊 품질 평가 {attempt_number}차: 평균 {avg_score:.1f}점, "
+            f"최저 {criteria_name(min_criteria, min_criteria)} {min_score:.1f}점, {pass_status}",
+            extra={"quality_evaluation": {
+                "attempt": attempt_number,
+                "scores": evaluation.scores,
+                "average": avg_score,
+                "minCriteria": min_criteria,
+                "pass": passed,
+                "feedback": feedback_preview
+            }}
+        )
+    
+    @staticmethod
+    def _format_quality_report(
+        evaluation: EvaluationResult,
+        attempt_number: int,
+        passing_threshold: float,
+        avg_score: float,
+        min_score: float,
+        min_criteria: str,
+        passed: bool,
+        feedback_preview: str
+    ) -> str:
+        """
+        사람이 읽기 위한 여러 줄 품질 평가 보고서 생성 (DEBUG 로그용)
         
-        # 평균 점수 계산
-        if score_count > 0:
-            avg_score = total_score / score_count
+        Args:
+            evaluation: 품질 평가 결과
+            attempt_number: 현재 시도 횟수
+            passing_threshold: 항목별 통과 기준 점수
+            avg_score: 평균 점수
+            min_score: 최저 점수
+            min_criteria: 최저 점수 항목
+            passed: 최종 통과 여부
+            feedback_preview: 길이 제한된 피드백
             
+        Returns:
+            str: 여러 줄 보고서 텍스트
+        """
+        lines = [f"📊 품질 평가 결과 - {attempt_number}차 시도", "=" * 50]
+        criteria_name = _CRITERIA_NAMES.get
+        
+        # 개별 점수 출력 (0-100점 기준)
+        for criteria, score in evaluation.scores.items():
+            # 점수 구간 테이블에서 이모지 선택 (100점 기준)
+            emoji = _SCORE_EMOJIS[bisect_right(_SCORE_THRESHOLDS, score)]
+            lines.append(f"{emoji} {criteria_name(criteria, criteria)}: {score:.1f}/100.0")
+        
+        if evaluation.scores:
             # 전체 등급 결정 (100점 기준)
-            if avg_score >= 90:
-                grade_emoji = "🏆"
-                grade = "우수"
-            elif avg_score >= 80:
-                grade_emoji = "✅"
-                grade = "양호"
-            elif avg_score >= 70:
-                grade_emoji = "⚠️"
-                grade = "보통"
-            else:
-                grade_emoji = "❌"
-                grade = "개선필요"
+            grade_emoji, grade = _GRADES[bisect_right(_GRADE_THRESHOLDS, avg_score)]
             
-            logger.info("-" * 30)
-            logger.info(f"{grade_emoji} 종합 점수: {avg_score:.1f}/100.0 ({grade})")
+            lines.append("-" * 30)
+            lines.append(f"{grade_emoji} 종합 점수: {avg_score:.1f}/100.0 ({grade})")
             
             # 최저 점수 항목 표시
-            min_score = min(evaluation.scores.values())
-            min_criteria = min(evaluation.scores.keys(), key=lambda k: evaluation.scores[k])
-            min_criteria_name = criteria_names.get(min_criteria, min_criteria)
-            if min_score < 85:
-                logger.info(f"🔍 개선필요 항목: {min_criteria_name} ({min_score:.1f}점)")
-        
-        # 통과 여부 (모든 항목 85점 이상이어야 통과)
-        passing_threshold = 85.0
-        all_passing = all(score >= passing_threshold for score in evaluation.scores.values())
+            if min_score < passing_threshold:
+                lines.append(f"🔍 개선필요 항목: {criteria_name(min_criteria, min_criteria)} ({min_score:.1f}점)")
         
-        pass_emoji = "✅" if evaluation.pass_ and all_passing else "❌"
-        pass_status = "통과" if evaluation.pass_ and all_passing else "재작업 필요"
-        logger.info(f"{pass_emoji} 품질 기준: {pass_status} (기준: 모든 항목 {passing_threshold}점 이상)")
+        pass_emoji = "✅" if passed else "❌"
+        pass_status = "통과" if passed else "재작업 필요"
+        lines.append(f"{pass_emoji} 품질 기준: {pass_status} (기준: 모든 항목 {passing_threshold}점 이상)")
         
-        # 피드백 출력 (150글자로 제한)
-        if evaluation.feedback:
-            feedback_preview = evaluation.feedback[:150] + "..." if len(evaluation.feedback) > 150 else evaluation.feedback
-            logger.info(f"💬 개선 피드백: {feedback_preview}")
+        if feedback_preview:
+            lines.append(f"💬 개선 피드백: {feedback_preview}")
         
-        logger.info("=" * 50)
\ No newline at end of file
+        lines.append("=" * 50)
+        return "\n".join(lines)
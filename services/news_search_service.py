@@ -3,21 +3,185 @@
 정치 관련 최신 뉴스를 검색하고 데이터를 정제하여 제공
 """
 
+import asyncio
 import httpx
 import logging
-import json
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 from urllib.parse import quote
 import html
 import re
+from functools import lru_cache
+from operator import itemgetter
 
-from schemas import Source
+import orjson
+
+from schemas import SourceDict
 from core.exceptions import NewsSearchException
 
 logger = logging.getLogger(__name__)
 
+# format_news_for_prompt의 뉴스 1건 포맷
+_PROMPT_NEWS_TEMPLATE = "[뉴스 {i}]\n제목: {title}\n내용: {description}\n발행일: {pub_date}\n링크: {link}"
+
+# 네이버 뉴스 검색 API 한도: 요청당 최대 100개, start 최대 1000
+_PAGE_SIZE = 100
+_MAX_START = 1000
+# 여러 페이지를 동시에 요청할 때 최대 동시 요청 수
+_PAGE_CONCURRENCY = 5
+# 서비스 인스턴스당 동시에 진행되는 네이버 API 호출 수 상한 (네이버 QPS 한도 ≈ 10)
+_NAVER_CONCURRENCY = 10
+# 이보다 많은 아이템은 정제 작업을 스레드에서 실행 (이벤트 루프 블로킹 방지)
+_OFFLOAD_ITEM_THRESHOLD = _PAGE_SIZE
+
+# 네이버 pubDate 고정 형식 파싱용 월 약어 → 숫자 / UTC 오프셋 문자열 → timezone 캐시
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12
+}
+_TZ_CACHE: Dict[str, timezone] = {}
+
+# 저장 파일명에 쓸 주제에서 제거할 문자 (문자/숫자/밑줄/하이픈/공백 외)
+_UNSAFE_TOPIC_CHARS_RE = re.compile(r'[^\w\- ]')
+
+# 뉴스 제목/설명의 HTML 태그 제거용 정규식 (아이템마다 패턴 캐시를 조회하지 않도록 미리 컴파일)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _strip_tags(text: str) -> str:
+    """
+    HTML 태그 제거 (엔티티 디코딩은 필터를 통과한 아이템에만 별도로 수행)
+    
+    태그가 없는 문자열은 정규식 치환을 건너뛰어 C 수준 검사만 거칩니다.
+    
+    Args:
+        text: 네이버 API의 제목/설명 문자열
+        
+    Returns:
+        str: 태그가 제거된 텍스트
+    """
+    if "<" in text:
+        return _HTML_TAG_RE.sub('', text)
+    return text
+
+
+def _pub_timestamp(news: Dict[str, Any]) -> float:
+    """
+    정제된 뉴스의 pubDate(ISO 8601)를 정렬용 타임스탬프로 변환
+    
+    Args:
+        news: _process_news_items가 반환한 뉴스 아이템
+        
+    Returns:
+        float: POSIX 타임스탬프 (파싱하지 못하면 가장 오래된 것으로 취급하여 0.0)
+    """
+    try:
+        return datetime.fromisoformat(news.get("pubDate", "")).timestamp()
+    except ValueError:
+        return 0.0
+
+
+# 정치 뉴스 판별 키워드 (중복 제거)
+_POLITICAL_KEYWORDS = (
+    # 정부 관련
+    "대통령", "정부", "청와대", "국무총리", "장관", "행정부",
+    # 국회 관련
+    "국회", "의원", "국정감사", "국정조사", "법안", "입법", "의정",
+    # 정당 관련
+    "민주당", "국민의힘", "정의당", "여당", "야당", "정치인", "정당",
+    # 정치 이슈
+    "선거", "투표", "공약", "정책", "개헌", "탄핵", "사퇴", "임명",
+    # 정치적 사건
+    "정치", "외교", "국정", "정무", "내각", "권력", "정치권"
+)
+# 키워드별 부분 문자열 검색 대신 한 번의 정규식 탐색으로 검사
+_POLITICAL_RE = re.compile("|".join(map(re.escape, _POLITICAL_KEYWORDS)))
+
+# 검색 쿼리 최적화용 정치 키워드 매핑
+_QUERY_KEYWORD_MAP = {
+    "윤석열": "윤석열 대통령",
+    "이재명": "이재명 민주당",
+    "탄핵": "탄핵 정치",
+    "국정감사": "국정감사 정치",
+    "선거": "선거 정치",
+    "여당": "여당 국민의힘",
+    "야당": "야당 민주당"
+}
+# 매핑 키워드를 한 번의 정규식 치환으로 확장 (키워드끼리 겹치지 않아 순차 replace와 결과 동일)
+_QUERY_KEYWORD_RE = re.compile("|".join(map(re.escape, _QUERY_KEYWORD_MAP)))
+# 쿼리에 이미 있으면 " 정치"를 덧붙이지 않는 키워드 (한 번의 정규식 탐색으로 검사)
+_QUERY_POLITICAL_MARKERS = ("정치", "대통령", "국회", "의원", "당")
+_QUERY_POLITICAL_RE = re.compile("|".join(map(re.escape, _QUERY_POLITICAL_MARKERS)))
+
+# 확장 검색용 정치인/정당별 키워드 패턴
+_KEYWORD_EXPANSIONS = {
+    "조국": ("조국혁신당", "조국 대표", "조국혁신정책연구원"),
+    "조국혁신당": ("조국", "강미정", "조국혁신당 성비위", "조국혁신당 대변인"),
+    "윤석열": ("윤석열 대통령", "윤석열 정부", "대통령실"),
+    "이재명": ("이재명 대표", "더불어민주당", "민주당"),
+    "탄핵": ("탄핵소추", "탄핵 정치", "국정조사"),
+    "국정감사": ("국정감사 정치", "국감", "국회 감사"),
+    "기자회견": ("브리핑", "기자간담회", "발표")
+}
+
+
+@lru_cache(maxsize=512)
+def _optimize_political_query(topic: str) -> str:
+    """
+    정치 관련 검색 쿼리를 최적화 (같은 주제는 캐시된 결과 재사용)
+    
+    Args:
+        topic: 원본 주제
+        
+    Returns:
+        str: 최적화된 검색 쿼리
+    """
+    # 기본 정치 키워드 추가
+    optimized = _QUERY_KEYWORD_RE.sub(lambda match: _QUERY_KEYWORD_MAP[match.group(0)], topic)
+    
+    # 정치 관련 키워드가 없으면 정치 키워드 추가 (키워드가 모두 한글이라 소문자 변환 불필요)
+    if _QUERY_POLITICAL_RE.search(optimized) is None:
+        optimized += " 정치"
+    
+    logger.debug("검색 쿼리 최적화: '%s' → '%s'", topic, optimized)
+    return optimized
+
+
+@lru_cache(maxsize=512)
+def _generate_expanded_keywords(topic: str) -> Tuple[str, ...]:
+    """
+    기본 주제를 바탕으로 확장 키워드 생성 (같은 주제는 캐시된 결과 재사용)
+    
+    Args:
+        topic: 기본 주제
+        
+    Returns:
+        Tuple[str, ...]: 확장된 키워드 목록
+    """
+    expanded_keywords: List[str] = []
+    
+    # 주제에 포함된 키워드 기반 확장
+    for key, expansions in _KEYWORD_EXPANSIONS.items():
+        if key in topic:
+            expanded_keywords.extend(expansions)
+    
+    # 일반적인 정치 키워드 조합
+    base_terms = topic.split()
+    if len(base_terms) > 1:
+        # 개별 단어들로도 검색
+        for term in base_terms:
+            if len(term) > 1:  # 한 글자 제외
+                expanded_keywords.append(term)
+    
+    # 중복 제거 및 원본 제외
+    expanded_keywords = list(set(expanded_keywords))
+    if topic in expanded_keywords:
+        expanded_keywords.remove(topic)
+    
+    logger.debug("키워드 확장: '%s' → %s", topic, expanded_keywords)
+    return tuple(expanded_keywords)
+
 
 class NaverNewsSearchService:
     """네이버 뉴스 검색 API 서비스 클래스"""
@@ -34,12 +198,60 @@ class NaverNewsSearchService:
         self.client_secret = client_secret
         self.base_url = "https://openapi.naver.com/v1/search/news.json"
         
-        # API 헤더 설정
-        self.headers = {
+        # API 헤더 설정 (httpx.Headers로 한 번만 만들어 클라이언트 생성 시 전달, 요청마다 병합하지 않음)
+        self.headers = httpx.Headers({
             "X-Naver-Client-Id": self.client_id,
             "X-Naver-Client-Secret": self.client_secret,
             "User-Agent": "ai-news-columnist/1.0"
-        }
+        })
+        
+        # 네이버 API용 HTTP 클라이언트 (첫 요청 시 생성, 요청 간 커넥션 재사용)
+        self._client: Optional[httpx.AsyncClient] = None
+        # API 호출 수 제한용 세마포어 (이벤트 루프에 바인딩되므로 실행 중인 루프별로 생성)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        재사용할 HTTP 클라이언트 반환 (없거나 닫혔으면 새로 생성)
+        
+        Returns:
+            httpx.AsyncClient: keep-alive 커넥션 풀을 가진 클라이언트
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=10)
+            )
+        return self._client
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """
+        현재 이벤트 루프용 API 호출 세마포어 반환 (없거나 다른 루프에서 만들었으면 새로 생성)
+        
+        Returns:
+            asyncio.Semaphore: 동시 호출 수를 제한하는 세마포어
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(_NAVER_CONCURRENCY)
+            self._semaphore_loop = loop
+        return self._semaphore
+    
+    async def close(self) -> None:
+        """HTTP 클라이언트 및 커넥션 풀 정리"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def __aenter__(self) -> "NaverNewsSearchService":
+        """비동기 컨텍스트 매니저 진입"""
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """비동기 컨텍스트 매니저 종료 시 HTTP 클라이언트 정리"""
+        await self.close()
     
     async def search_recent_news(
         self, 
@@ -54,7 +266,7 @@ class NaverNewsSearchService:
         
         Args:
             topic: 검색할 주제 키워드
-            max_results: 최대 결과 개수 (기본 20개, 최대 100개)
+            max_results: 최대 결과 개수 (기본 20개, 100개 초과 시 페이지를 동시에 요청, 최대 1000개)
             days_back: 검색 기간 (일 단위, 기본 7일)
             sort_by: 정렬 방식 ('date' 또는 'sim')
             search_mode: 검색 범위 ('title': 제목만, 'all': 제목+내용)
@@ -63,47 +275,79 @@ class NaverNewsSearchService:
             List[Dict[str, Any]]: 검색된 뉴스 목록
         """
         try:
-            logger.info(f"네이버 뉴스 검색 시작: '{topic}' (최근 {days_back}일)")
+            logger.info("네이버 뉴스 검색 시작: '%s' (최근 %d일)", topic, days_back)
             
             # 검색 쿼리 최적화 - 정치 관련 키워드 추가
             optimized_query = self._optimize_political_query(topic)
             
-            # API 요청 파라미터 설정
-            params = {
-                "query": optimized_query,
-                "display": min(max_results, 100),  # 최대 100개로 제한
-                "start": 1,
-                "sort": sort_by  # 'date' (최신순) 또는 'sim' (관련도순)
-            }
-            
-            # 네이버 API 호출
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    self.base_url,
-                    headers=self.headers,
-                    params=params,
-                    timeout=30.0
-                )
-                
-                if response.status_code != 200:
-                    logger.error(f"네이버 API 호출 실패: {response.status_code}")
-                    raise NewsSearchException(f"뉴스 검색 API 오류: {response.status_code}")
-                
-                data = response.json()
+            # API 요청 파라미터 설정 (요청당 100개 한도라 start를 100씩 늘린 페이지로 분할)
+            total = min(max_results, _MAX_START)
+            pages = [
+                {
+                    "query": optimized_query,
+                    "display": min(_PAGE_SIZE, total - start + 1),
+                    "start": start,
+                    "sort": sort_by  # 'date' (최신순) 또는 'sim' (관련도순)
+                }
+                for start in range(1, total + 1, _PAGE_SIZE)
+            ]
+            
+            if len(pages) == 1:
+                raw_items = await self._fetch_page(pages[0])
+            else:
+                # 여러 페이지는 동시에 요청 (전체 대기 시간 ≈ 가장 느린 한 요청)
+                semaphore = asyncio.Semaphore(_PAGE_CONCURRENCY)
                 
-                # 뉴스 데이터 정제 및 필터링 (검색 모드 적용)
-                news_items = self._process_news_items(data.get("items", []), days_back, search_mode, topic)
+                async def _fetch_limited(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+                    async with semaphore:
+                        return await self._fetch_page(params)
                 
-                logger.info(f"뉴스 검색 완료: {len(news_items)}개 뉴스 발견")
-                return news_items
+                page_results = await asyncio.gather(*(_fetch_limited(params) for params in pages))
+                raw_items = [item for page_items in page_results for item in page_items]
+            
+            # 뉴스 데이터 정제 및 필터링 (검색 모드 적용)
+            # 한 페이지 분량은 스레드 전환 비용보다 작업이 작아 바로 처리하고, 여러 페이지일 때만 스레드로 넘김
+            if len(raw_items) > _OFFLOAD_ITEM_THRESHOLD:
+                news_items = await asyncio.to_thread(
+                    self._process_news_items, raw_items, days_back, search_mode, topic
+                )
+            else:
+                news_items = self._process_news_items(raw_items, days_back, search_mode, topic)
+            
+            logger.info("뉴스 검색 완료: %d개 뉴스 발견", len(news_items))
+            return news_items
                 
         except httpx.TimeoutException:
             logger.error("네이버 API 호출 타임아웃")
             raise NewsSearchException("뉴스 검색 타임아웃")
         except Exception as e:
-            logger.error(f"뉴스 검색 중 오류: {str(e)}")
+            logger.error("뉴스 검색 중 오류: %s", e)
             raise NewsSearchException(f"뉴스 검색 실패: {str(e)}")
     
+    async def _fetch_page(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        네이버 뉴스 검색 API 한 페이지 호출
+        
+        Args:
+            params: API 요청 파라미터 (query/display/start/sort)
+            
+        Returns:
+            List[Dict[str, Any]]: 응답의 원본 뉴스 아이템 목록
+        """
+        # 네이버 API 호출 (공유 클라이언트로 TCP/TLS 연결 재사용)
+        # 동시 요청이 몰려도 한도를 넘지 않도록 세마포어로 호출 수 제한 (429 후 재시도 방지)
+        async with self._get_semaphore():
+            response = await self._get_client().get(self.base_url, params=params)
+        
+        if response.status_code != 200:
+            logger.error("네이버 API 호출 실패: %d", response.status_code)
+            raise NewsSearchException(f"뉴스 검색 API 오류: {response.status_code}")
+        
+        # 응답 본문 bytes를 orjson으로 바로 파싱 (stdlib json 대비 빠름)
+        data = orjson.loads(response.content)
+        items: List[Dict[str, Any]] = data.get("items", [])
+        return items
+    
     def _optimize_political_query(self, topic: str) -> str:
         """
         정치 관련 검색 쿼리를 최적화
@@ -114,29 +358,7 @@ class NaverNewsSearchService:
         Returns:
             str: 최적화된 검색 쿼리
         """
-        # 정치 관련 키워드 매핑
-        political_keywords = {
-            "윤석열": "윤석열 대통령",
-            "이재명": "이재명 민주당",
-            "탄핵": "탄핵 정치",
-            "국정감사": "국정감사 정치",
-            "선거": "선거 정치",
-            "여당": "여당 국민의힘",
-            "야당": "야당 민주당"
-        }
-        
-        # 기본 정치 키워드 추가
-        optimized = topic
-        for keyword, enhanced in political_keywords.items():
-            if keyword in topic:
-                optimized = optimized.replace(keyword, enhanced)
-        
-        # 정치 관련 키워드가 없으면 정치 키워드 추가
-        if not any(keyword in optimized.lower() for keyword in ["정치", "대통령", "국회", "의원", "당"]):
-            optimized += " 정치"
-        
-        logger.debug(f"검색 쿼리 최적화: '{topic}' → '{optimized}'")
-        return optimized
+        return _optimize_political_query(topic)
     
     def _process_news_items(
         self, 
@@ -157,38 +379,48 @@ class NaverNewsSearchService:
         Returns:
             List[Dict[str, Any]]: 정제된 뉴스 목록
         """
-        processed_items = []
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
+        # (발행 시각 타임스탬프, 아이템) - 문자열 대신 숫자 키로 정렬하기 위해 함께 보관
+        dated_items: List[Tuple[float, Dict[str, Any]]] = []
+        # 기간 필터 기준 시각을 타임스탬프로 한 번만 계산 (아이템마다 datetime 비교 대신 float 비교)
+        cutoff_ts = (datetime.now(timezone.utc) - timedelta(days=days_back)).timestamp()
+        # "title" 모드의 주제 키워드는 호출당 한 번만 계산 (그 외 모드나 주제가 없으면 필터링 생략)
+        topic_keywords = tuple(topic.lower().split()) if search_mode == "title" and topic else ()
+        # 주제에 대소문자가 있는 문자(영문 등)가 있을 때만 제목을 소문자로 변환 (한글만이면 복사 생략)
+        fold_title_case = topic.lower() != topic.upper()
         
         for item in items:
             try:
-                # HTML 태그 제거 및 텍스트 정제
-                title = html.unescape(re.sub(r'<[^>]+>', '', item.get("title", "")))
-                description = html.unescape(re.sub(r'<[^>]+>', '', item.get("description", "")))
-                
-                # 발행일 파싱 (네이버 형식: "Tue, 03 Sep 2024 10:30:00 +0900")
+                # 가장 싼 검사부터: 발행일 파싱 (네이버 형식: "Tue, 03 Sep 2024 10:30:00 +0900")
                 pub_date_str = item.get("pubDate", "")
                 pub_date = self._parse_naver_date(pub_date_str)
+                # 발행일을 파싱하지 못한 아이템은 기간 필터를 통과시키고 정렬 시 가장 오래된 것으로 취급
+                pub_ts = pub_date.timestamp() if pub_date else None
                 
-                # 기간 필터링 - 설정된 기간 내의 뉴스만 포함
-                if pub_date and pub_date < cutoff_date:
+                # 기간 필터링 - 설정된 기간 내의 뉴스만 포함 (기간 밖 아이템은 텍스트 정제 생략)
+                if pub_ts is not None and pub_ts < cutoff_ts:
                     continue
                 
-                # 정치 관련성 검증
-                if not self._is_political_news(title, description):
-                    continue
+                # 제목 HTML 태그 제거 및 엔티티 디코딩
+                # (네이버가 검색어를 <b>로 강조하며 키워드를 쪼갤 수 있어 필터링 전에 수행)
+                title = html.unescape(_strip_tags(item.get("title", "")))
                 
                 # 검색 모드에 따른 키워드 필터링
-                if search_mode == "title" and topic:
+                # 제목만 보는 가장 싼 필터라 설명 정제/정치 판별보다 먼저 수행
+                if topic_keywords:
                     # "title" 모드: 제목에서만 키워드 검색
-                    topic_keywords = topic.lower().split()
-                    title_lower = title.lower()
+                    title_lower = title.lower() if fold_title_case else title
                     
                     # 모든 키워드가 제목에 포함되어야 함
                     if not all(keyword in title_lower for keyword in topic_keywords):
                         continue
                 # "all" 모드 또는 topic이 없는 경우: 기존대로 모든 뉴스 허용
                 
+                # 정치 관련성 검증 (설명의 엔티티 디코딩은 통과한 아이템만 - 한국어 키워드는 엔티티로 인코딩되지 않음)
+                description = _strip_tags(item.get("description", ""))
+                if not self._is_political_news(title, description):
+                    continue
+                description = html.unescape(description)
+                
                 processed_item = {
                     "title": title,
                     "description": description,
@@ -198,16 +430,17 @@ class NaverNewsSearchService:
                     "naverLink": item.get("link", "")
                 }
                 
-                processed_items.append(processed_item)
+                dated_items.append((pub_ts if pub_ts is not None else 0.0, processed_item))
                 
             except Exception as e:
-                logger.warning(f"뉴스 아이템 처리 중 오류: {str(e)}")
+                logger.warning("뉴스 아이템 처리 중 오류: %s", e)
                 continue
         
-        # 발행일 순으로 정렬 (최신순)
-        processed_items.sort(key=lambda x: x["pubDate"], reverse=True)
+        # 발행일 순으로 정렬 (최신순, 시간대가 달라도 정확하도록 타임스탬프 비교)
+        dated_items.sort(key=itemgetter(0), reverse=True)
+        processed_items = [item for _, item in dated_items]
         
-        logger.debug(f"뉴스 정제 완료: {len(items)}개 → {len(processed_items)}개")
+        logger.debug("뉴스 정제 완료: %d개 → %d개", len(items), len(processed_items))
         return processed_items
     
     def _parse_naver_date(self, date_str: str) -> Optional[datetime]:
@@ -220,12 +453,28 @@ class NaverNewsSearchService:
         Returns:
             Optional[datetime]: 파싱된 datetime 객체
         """
+        # 네이버 형식: "Tue, 03 Sep 2024 10:30:00 +0900"
+        # 고정 위치 슬라이스로 바로 파싱 (strptime의 포맷 해석/로케일 조회 생략)
+        if len(date_str) == 31 and date_str[26] in "+-":
+            try:
+                offset = date_str[26:]
+                tz = _TZ_CACHE.get(offset)
+                if tz is None:
+                    minutes = int(offset[1:3]) * 60 + int(offset[3:5])
+                    tz = timezone(timedelta(minutes=-minutes if offset[0] == "-" else minutes))
+                    _TZ_CACHE[offset] = tz
+                return datetime(
+                    int(date_str[12:16]), _MONTHS[date_str[8:11]], int(date_str[5:7]),
+                    int(date_str[17:19]), int(date_str[20:22]), int(date_str[23:25]),
+                    tzinfo=tz
+                )
+            except (KeyError, ValueError):
+                pass  # 형식이 조금이라도 다르면 아래 strptime으로 처리
+        
         try:
-            # 네이버 형식: "Tue, 03 Sep 2024 10:30:00 +0900"
-            # strptime으로 파싱
             return datetime.strptime(date_str, "%a, %d %b %Y %H:%M:%S %z")
         except Exception as e:
-            logger.warning(f"날짜 파싱 실패: {date_str} - {str(e)}")
+            logger.warning("날짜 파싱 실패: %s - %s", date_str, e)
             return None
     
     def _is_political_news(self, title: str, description: str) -> bool:
@@ -239,49 +488,29 @@ class NaverNewsSearchService:
         Returns:
             bool: 정치 뉴스 여부
         """
-        political_keywords = [
-            # 정부 관련
-            "대통령", "정부", "청와대", "국무총리", "장관", "정부", "행정부",
-            # 국회 관련  
-            "국회", "의원", "국정감사", "국정조사", "법안", "입법", "의정",
-            # 정당 관련
-            "민주당", "국민의힘", "정의당", "여당", "야당", "정치인", "정당",
-            # 정치 이슈
-            "선거", "투표", "공약", "정책", "개헌", "탄핵", "사퇴", "임명",
-            # 정치적 사건
-            "정치", "외교", "국정", "정무", "내각", "권력", "정치권"
-        ]
-        
-        text = (title + " " + description).lower()
-        
-        # 정치 키워드가 포함되어 있는지 확인
-        return any(keyword in text for keyword in political_keywords)
+        # 정치 키워드가 포함되어 있는지 확인 (첫 매칭에서 종료)
+        # 키워드가 모두 한글이라 소문자 변환이 필요 없고, 제목/설명을 이어 붙이지 않고 각각 검사
+        return _POLITICAL_RE.search(title) is not None or _POLITICAL_RE.search(description) is not None
     
-    def convert_to_sources(self, news_items: List[Dict[str, Any]]) -> List[Source]:
+    def convert_to_sources(self, news_items: List[Dict[str, Any]]) -> List[SourceDict]:
         """
-        뉴스 데이터를 Source 스키마로 변환
+        뉴스 데이터를 참고 자료(SourceDict) 목록으로 변환
         
         Args:
             news_items: 검색된 뉴스 아이템들
             
         Returns:
-            List[Source]: Source 스키마로 변환된 목록
+            List[SourceDict]: 참고 자료 목록 (API 응답 시 Source 모델로 변환)
         """
-        sources = []
-        
-        for item in news_items:
-            try:
-                source = Source(
-                    title=item["title"],
-                    uri=item.get("link", "")
-                )
-                sources.append(source)
-                
-            except Exception as e:
-                logger.warning(f"Source 변환 중 오류: {str(e)}")
-                continue
+        # 정제된 뉴스는 title/link를 항상 가지므로 항목별 예외 처리 없이 한 번에 변환
+        # (title이 없는 항목은 기존처럼 건너뜀)
+        sources: List[SourceDict] = [
+            {"title": item["title"], "uri": item.get("link", "")}
+            for item in news_items
+            if "title" in item
+        ]
         
-        logger.info(f"Source 변환 완료: {len(sources)}개")
+        logger.info("Source 변환 완료: %d개", len(sources))
         return sources
     
     def format_news_for_prompt(self, news_items: List[Dict[str, Any]]) -> str:
@@ -297,19 +526,17 @@ class NaverNewsSearchService:
         if not news_items:
             return "관련 뉴스를 찾을 수 없습니다."
         
-        formatted_news = []
-        
-        for i, item in enumerate(news_items[:10], 1):  # 최대 10개만 사용
-            news_text = f"""
-[뉴스 {i}]
-제목: {item['title']}
-내용: {item['description']}
-발행일: {item['pubDate']}
-링크: {item.get('originalLink', item.get('link', ''))}
-"""
-            formatted_news.append(news_text.strip())
-        
-        return "\n\n".join(formatted_news)
+        # 최대 10개만 사용, 앞뒤 공백 없는 템플릿으로 바로 포맷하여 한 번에 join
+        return "\n\n".join(
+            _PROMPT_NEWS_TEMPLATE.format(
+                i=i,
+                title=item['title'],
+                description=item['description'],
+                pub_date=item['pubDate'],
+                link=item.get('originalLink', item.get('link', ''))
+            )
+            for i, item in enumerate(news_items[:10], 1)
+        )
     
     def save_news_data_to_json(
         self, 
@@ -331,8 +558,7 @@ class NaverNewsSearchService:
         try:
             # 타임스탬프 생성
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_topic = "".join(c for c in topic if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            safe_topic = safe_topic.replace(' ', '_')
+            safe_topic = _UNSAFE_TOPIC_CHARS_RE.sub('', topic).rstrip().replace(' ', '_')
             
             # 파일 경로 생성
             filename = f"news_{safe_topic}_{timestamp}.json"
@@ -356,15 +582,15 @@ class NaverNewsSearchService:
             if save_analysis:
                 save_data["analysis"] = self._analyze_news_quality(news_items)
             
-            # JSON 파일로 저장
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=2)
+            # JSON 파일로 저장 (orjson은 UTF-8 bytes로 바로 직렬화, 한글 이스케이프 없음)
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(save_data, option=orjson.OPT_INDENT_2))
             
-            logger.info(f"뉴스 데이터 저장 완료: {filepath}")
+            logger.info("뉴스 데이터 저장 완료: %s", filepath)
             return filepath
             
         except Exception as e:
-            logger.error(f"뉴스 데이터 저장 실패: {str(e)}")
+            logger.error("뉴스 데이터 저장 실패: %s", e)
             raise NewsSearchException(f"JSON 저장 실패: {str(e)}")
     
     def _analyze_news_quality(self, news_items: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -380,14 +606,35 @@ class NaverNewsSearchService:
         if not news_items:
             return {"error": "분석할 뉴스 데이터가 없습니다"}
         
-        # description 길이 통계
-        desc_lengths = []
+        # description 길이 통계를 한 번의 순회로 집계 (합계/최소/최대/구간별 개수/최장·최단 아이템)
+        total_desc_length = 0
         empty_desc_count = 0
         has_original_link_count = 0
+        very_short = short = medium = long = 0
+        longest_desc_item = shortest_desc_item = news_items[0]
+        max_desc_length = min_desc_length = len(longest_desc_item.get('description', ''))
         
         for item in news_items:
             desc = item.get('description', '')
-            desc_lengths.append(len(desc))
+            length = len(desc)
+            total_desc_length += length
+            
+            # 같은 길이면 먼저 나온 아이템 유지 (max/min과 동일)
+            if length > max_desc_length:
+                max_desc_length = length
+                longest_desc_item = item
+            elif length < min_desc_length:
+                min_desc_length = length
+                shortest_desc_item = item
+            
+            if length <= 50:
+                very_short += 1
+            elif length <= 100:
+                short += 1
+            elif length <= 200:
+                medium += 1
+            else:
+                long += 1
             
             if not desc.strip():
                 empty_desc_count += 1
@@ -395,14 +642,7 @@ class NaverNewsSearchService:
             if item.get('originalLink'):
                 has_original_link_count += 1
         
-        # 통계 계산
-        avg_desc_length = sum(desc_lengths) / len(desc_lengths) if desc_lengths else 0
-        min_desc_length = min(desc_lengths) if desc_lengths else 0
-        max_desc_length = max(desc_lengths) if desc_lengths else 0
-        
-        # 샘플 뉴스 선택 (가장 긴 description과 가장 짧은 것)
-        longest_desc_item = max(news_items, key=lambda x: len(x.get('description', '')))
-        shortest_desc_item = min(news_items, key=lambda x: len(x.get('description', '')))
+        avg_desc_length = total_desc_length / len(news_items)
         
         analysis = {
             "quality_metrics": {
@@ -417,23 +657,23 @@ class NaverNewsSearchService:
                 "min_length": min_desc_length,
                 "max_length": max_desc_length,
                 "length_distribution": {
-                    "very_short_0_50": sum(1 for l in desc_lengths if 0 <= l <= 50),
-                    "short_51_100": sum(1 for l in desc_lengths if 51 <= l <= 100),
-                    "medium_101_200": sum(1 for l in desc_lengths if 101 <= l <= 200),
-                    "long_201_plus": sum(1 for l in desc_lengths if l > 200)
+                    "very_short_0_50": very_short,
+                    "short_51_100": short,
+                    "medium_101_200": medium,
+                    "long_201_plus": long
                 }
             },
             "sample_items": {
                 "longest_description": {
                     "title": longest_desc_item.get('title', ''),
                     "description": longest_desc_item.get('description', ''),
-                    "length": len(longest_desc_item.get('description', '')),
+                    "length": max_desc_length,
                     "link": longest_desc_item.get('originalLink', '')
                 },
                 "shortest_description": {
                     "title": shortest_desc_item.get('title', ''),
                     "description": shortest_desc_item.get('description', ''),
-                    "length": len(shortest_desc_item.get('description', '')),
+                    "length": min_desc_length,
                     "link": shortest_desc_item.get('originalLink', '')
                 }
             }
@@ -514,77 +754,58 @@ class NaverNewsSearchService:
             List[Dict[str, Any]]: 확장된 뉴스 목록 (중복 제거됨)
         """
         try:
-            logger.info(f"확장 뉴스 검색 시작: '{topic}' (키워드 확장: {use_keyword_expansion})")
-            
-            all_news = []
-            seen_urls = set()  # 중복 제거용
-            
-            # 1. 기본 키워드로 검색 (최신순)
-            logger.info("1단계: 기본 키워드 검색 (최신순)")
-            news_date = await self.search_recent_news(
-                topic=topic,
-                max_results=min(max_results, 40),
-                days_back=days_back,
-                sort_by="date"
+            logger.info("확장 뉴스 검색 시작: '%s' (키워드 확장: %s)", topic, use_keyword_expansion)
+            
+            # 기본 키워드 검색(최신순/관련도순)과 확장 키워드 검색(최대 3개)은 서로 독립적이므로 동시에 요청
+            # (전체 대기 시간 ≈ 가장 느린 한 요청, 공유 클라이언트의 keep-alive 커넥션 재사용)
+            base_max_results = min(max_results, 40)
+            expanded_keywords = self._generate_expanded_keywords(topic)[:3] if use_keyword_expansion else []
+            logger.info(
+                "기본 키워드 검색 2건(최신순/관련도순) + 확장 키워드 검색 %d건 동시 실행: %s",
+                len(expanded_keywords), expanded_keywords
             )
             
-            for news in news_date:
-                url = news.get('originalLink') or news.get('link')
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    all_news.append(news)
-            
-            # 2. 기본 키워드로 검색 (관련도순)
-            logger.info("2단계: 기본 키워드 검색 (관련도순)")
-            news_sim = await self.search_recent_news(
-                topic=topic,
-                max_results=min(max_results, 40),
-                days_back=days_back,
-                sort_by="sim"
+            results = await asyncio.gather(
+                self.search_recent_news(topic=topic, max_results=base_max_results, days_back=days_back, sort_by="date"),
+                self.search_recent_news(topic=topic, max_results=base_max_results, days_back=days_back, sort_by="sim"),
+                *(
+                    self.search_recent_news(topic=keyword, max_results=30, days_back=days_back, sort_by="date")
+                    for keyword in expanded_keywords
+                ),
+                return_exceptions=True
             )
             
-            for news in news_sim:
-                url = news.get('originalLink') or news.get('link')
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    all_news.append(news)
+            # 요청 순서(최신순 → 관련도순 → 확장 키워드)대로 결과를 모음
+            news_lists: List[List[Dict[str, Any]]] = []
+            for i, result in enumerate(results):
+                if isinstance(result, BaseException):
+                    if i < 2:
+                        # 기본 검색 실패는 아래 폴백 처리로 전달
+                        raise result
+                    logger.warning("확장 키워드 '%s' 검색 실패: %s", expanded_keywords[i - 2], result)
+                    continue
+                news_lists.append(result)
             
-            # 3. 키워드 확장 검색
-            if use_keyword_expansion:
-                expanded_keywords = self._generate_expanded_keywords(topic)
-                
-                for i, keyword in enumerate(expanded_keywords[:3], 1):  # 최대 3개까지
-                    logger.info(f"{i+2}단계: 확장 키워드 '{keyword}' 검색")
-                    
-                    try:
-                        expanded_news = await self.search_recent_news(
-                            topic=keyword,
-                            max_results=30,
-                            days_back=days_back,
-                            sort_by="date"
-                        )
-                        
-                        for news in expanded_news:
-                            url = news.get('originalLink') or news.get('link')
-                            if url and url not in seen_urls:
-                                seen_urls.add(url)
-                                all_news.append(news)
-                                
-                    except Exception as e:
-                        logger.warning(f"확장 키워드 '{keyword}' 검색 실패: {str(e)}")
-                        continue
+            # URL 기준 중복 제거 (먼저 요청한 검색 결과 우선, dict의 삽입 순서 유지를 이용해 컨테이너 하나로 처리)
+            news_by_url: Dict[str, Dict[str, Any]] = {}
+            for news_list in news_lists:
+                for news in news_list:
+                    url = news.get('originalLink') or news.get('link')
+                    if url:
+                        news_by_url.setdefault(url, news)
+            all_news = list(news_by_url.values())
             
-            # 4. 결과 정렬 (최신순)
-            all_news.sort(key=lambda x: x.get("pubDate", ""), reverse=True)
+            # 결과 정렬 (최신순, 문자열 대신 타임스탬프 비교 - 키는 아이템당 한 번만 계산됨)
+            all_news.sort(key=_pub_timestamp, reverse=True)
             
-            # 5. 최대 결과 수로 제한
+            # 최대 결과 수로 제한
             final_news = all_news[:max_results]
             
-            logger.info(f"확장 검색 완료: {len(final_news)}개 뉴스 (중복 제거됨)")
+            logger.info("확장 검색 완료: %d개 뉴스 (중복 제거됨)", len(final_news))
             return final_news
             
         except Exception as e:
-            logger.error(f"확장 뉴스 검색 실패: {str(e)}")
+            logger.error("확장 뉴스 검색 실패: %s", e)
             # 실패시 기본 검색으로 폴백
             return await self.search_recent_news(topic, max_results//2, days_back)
     
@@ -598,36 +819,5 @@ class NaverNewsSearchService:
         Returns:
             List[str]: 확장된 키워드 목록
         """
-        expanded_keywords = []
-        
-        # 정치인/정당별 확장 패턴
-        political_expansions = {
-            "조국": ["조국혁신당", "조국 대표", "조국혁신정책연구원"],
-            "조국혁신당": ["조국", "강미정", "조국혁신당 성비위", "조국혁신당 대변인"],
-            "윤석열": ["윤석열 대통령", "윤석열 정부", "대통령실"],
-            "이재명": ["이재명 대표", "더불어민주당", "민주당"],
-            "탄핵": ["탄핵소추", "탄핵 정치", "국정조사"],
-            "국정감사": ["국정감사 정치", "국감", "국회 감사"],
-            "기자회견": ["브리핑", "기자간담회", "발표"]
-        }
-        
-        # 주제에 포함된 키워드 기반 확장
-        for key, expansions in political_expansions.items():
-            if key in topic:
-                expanded_keywords.extend(expansions)
-        
-        # 일반적인 정치 키워드 조합
-        base_terms = topic.split()
-        if len(base_terms) > 1:
-            # 개별 단어들로도 검색
-            for term in base_terms:
-                if len(term) > 1:  # 한 글자 제외
-                    expanded_keywords.append(term)
-        
-        # 중복 제거 및 원본 제외
-        expanded_keywords = list(set(expanded_keywords))
-        if topic in expanded_keywords:
-            expanded_keywords.remove(topic)
-        
-        logger.debug(f"키워드 확장: '{topic}' → {expanded_keywords}")
-        return expanded_keywords
\ No newline at end of file
+        # 캐시된 튜플을 호출자가 수정하지 않도록 리스트로 복사해 반환
+        return list(_generate_expanded_keywords(topic))
@@ -0,0 +1,37 @@
+"""
+OpenAI 클라이언트 공유 모듈
+컨텐츠 생성/평가 서비스가 같은 AsyncOpenAI 클라이언트(커넥션 풀)를 재사용하도록 관리
+"""
+
+from functools import lru_cache
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+# OpenAI 호출 1회당 최대 대기 시간 (초) - 응답이 멈춘 호출이 워커를 무기한 점유하지 않도록 제한
+OPENAI_TIMEOUT_SECONDS = 45.0
+
+# 커넥션 풀 설정: 기본 keep-alive 유지 시간(5초)은 요청 간격보다 짧아 매 요청마다
+# TCP/TLS 핸드셰이크가 반복되므로, 유휴 연결을 더 오래 유지하고 풀 크기는 워커 규모에 맞춤
+_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=32,
+    keepalive_expiry=60.0
+)
+
+
+@lru_cache(maxsize=4)
+def get_openai_client(api_key: str) -> AsyncOpenAI:
+    """
+    API 키별 AsyncOpenAI 클라이언트 반환 (프로세스당 1회만 생성)
+
+    Args:
+        api_key: OpenAI API 키
+
+    Returns:
+        AsyncOpenAI: 캐시된 OpenAI 클라이언트
+    """
+    return AsyncOpenAI(
+        api_key=api_key,
+        http_client=DefaultAsyncHttpxClient(limits=_CONNECTION_LIMITS)
+    )
@@ -2,18 +2,43 @@
 프롬프트 생성 및 관리
 """
 
-from datetime import datetime
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+
+# 평가 결과 JSON 스키마 (OpenAI strict json_schema 응답 형식, 호출마다 dict를 새로 만들지 않도록 모듈 상수로 보관)
+_EVALUATION_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "scores": {
+            "type": "object",
+            "properties": {
+                "format": {"type": "number", "description": "양식 준수 점수 (0-100)"},
+                "balance": {"type": "number", "description": "균형성 점수 (0-100)"},
+                "readability": {"type": "number", "description": "가독성 점수 (0-100)"},
+                "completeness": {"type": "number", "description": "완성도 점수 (0-100)"},
+                "objectivity": {"type": "number", "description": "객관성 점수 (0-100)"}
+            },
+            "required": ["format", "balance", "readability", "completeness", "objectivity"],
+            "additionalProperties": False
+        },
+        "pass": {"type": "boolean", "description": "모든 점수가 85점 이상이면 true"},
+        "feedback": {"type": "string", "description": "개선이 필요한 경우 구체적인 피드백, 통과 시 칭찬"},
+        "revisedContent": {"type": "string", "description": "피드백을 바탕으로 수정된 최종 원고"}
+    },
+    "required": ["scores", "pass", "feedback", "revisedContent"],
+    "additionalProperties": False  # strict 모드 필수 조건
+}
 
 
 class PromptGenerator:
-    """프롬프트 생성 클래스"""
+    """
+    프롬프트 생성 클래스
     
-    def __init__(self):
-        """프롬프트 생성기 초기화"""
-        
-        # 작성 규칙 정의
-        self.writing_rules = """
+    고정 프롬프트 조각(작성 규칙/템플릿/평가 기준)은 클래스 속성으로 한 번만 만들어 모든 인스턴스가 공유합니다.
+    """
+    
+    # 작성 규칙 정의
+    writing_rules = """
 - 정치 초보자도 이해할 수 있는 쉬운 용어와 설명으로 작성.
 - 종결어미는 반드시 "~~이다."와 같은 보도문체를 사용해주세요.
 - 본문 중 중요한 키워드들은 **단어** 형식으로 볼드 처리하여 가독성을 높여주세요.
@@ -27,10 +52,10 @@ class PromptGenerator:
   * 진보: 민주당, 더불어민주당, 조국혁신당, 정청래, 정의당, 조국, 여당, 이재명 등
   * 보수: 국민의힘, 야당, 국힘, 이준석, 한동훈, 안철수, 개혁신당, 전한길, 장동혁, 나경원, 김문수, 윤석열 등
  - 요약(첫 번째 요약 단락)은 최대 300자 이내로 작성하세요. 300자를 초과하지 마세요.
-        """.strip()
-        
-        # 템플릿 정의 (마크다운 형식)
-        self.template = """
+    """.strip()
+    
+    # 템플릿 정의 (마크다운 형식)
+    template = """
 ## 핵심 내용을 잘 드러내며 흥미를 유발하는 중립적인 제목, 뉴스에서 가장 많이 언급된 키워드들을 활용
 
 핵심 내용을 요약하여 최대 300자 이내로 간결하게 작성
@@ -67,10 +92,10 @@ class PromptGenerator:
 ### 🎯 진영별 입장 참고 뉴스
 - [뉴스 제목](뉴스 URL)
 - [뉴스 제목](뉴스 URL)
-        """.strip()
-        
-        # 평가 기준 정의
-        self.evaluation_criteria = """
+    """.strip()
+    
+    # 평가 기준 정의
+    evaluation_criteria = """
 1. 양식 준수 (Format Compliance):
     - 정해진 템플릿 구조(제목, 요약, 진영별 입장, 내용, 결론)를 모두 포함하고 있는가?
     - <진보 진영 입장>과 <보수 진영 입장>에 각각 정확히 3개의 bullet point가 포함되었는가?
@@ -80,43 +105,42 @@ class PromptGenerator:
     - 가독성 (Readability): 정치 초보자도 이해할 수 있는 쉬운 용어와 설명으로 작성되었는가?
     - 완성도 (Completeness): 논리적 흐름이 자연스럽고, 주제를 이해하기에 정보가 충분한가?
     - 객관성 (Objectivity): 사실에 기반하여 편향되지 않은 서술을 유지하고 있는가?
-        """.strip()
-    
+    """.strip()
 
-    def get_draft_prompt_with_news(self, topic: str, news_summary: str, news_sources=None) -> str:
+    def get_draft_prompt_with_news(
+        self, topic: str, news_summary: str, news_sources: Optional[List[Dict[str, str]]] = None
+    ) -> str:
         """
         뉴스 정보를 포함한 초안 생성 프롬프트
         
         Args:
             topic: 컬럼 주제
             news_summary: 수집된 뉴스 정보 요약
+            news_sources: 참고 뉴스 소스 목록 (title, link 또는 url)
             
         Returns:
             str: 뉴스 기반 초안 생성 프롬프트
         """
-        # 현재 날짜 정보 가져오기 (사용하지 않지만 향후 확장 가능)
-        
-        # 템플릿에 주제 적용
-        formatted_template = self.template.format(topic=topic)
-        
-        # 뉴스 소스 정보 포맷팅
+        # 뉴스 소스 정보 포맷팅 (한 번의 join으로 구성)
         sources_text = ""
         if news_sources:
-            sources_text = "\n\n[참고 뉴스 소스]\n"
-            for i, source in enumerate(news_sources, 1):
-                sources_text += f"{i}. [{source.get('title', 'N/A')}]({source.get('link', source.get('url', '#'))})\n"
+            sources_text = "\n\n[참고 뉴스 소스]\n" + "".join(
+                f"{i}. [{source.get('title', 'N/A')}]({source.get('link', source.get('url', '#'))})\n"
+                for i, source in enumerate(news_sources, 1)
+            )
         
+        # 템플릿에는 치환할 필드가 없으므로 그대로 사용 (str.format은 중괄호가 들어가면 오류 위험만 있음)
         return f"""
 다음 최신 뉴스 정보를 바탕으로 '{topic}'에 대한 컬럼 콘텐츠를 작성해주세요.
 
 [최신 뉴스 정보]
-{news_summary}{news_sources}{sources_text}
+{news_summary}{sources_text}
 
 [작성 규칙]
 {self.writing_rules}
 
 [템플릿]
-{formatted_template}
+{self.template}
 
 **중요**: 위 뉴스 정보를 활용하여 최신 동향과 구체적인 사실을 반영한 컬럼을 작성해주세요.
 반드시 진보와 보수 진영의 입장은 실제 뉴스에서 언급된 내용을 바탕으로 작성해주세요.
@@ -202,28 +226,21 @@ JSON 형식으로 응답해주세요:
 
     def get_evaluation_schema(self) -> Dict[str, Any]:
         """
-        평가 결과를 위한 JSON 스키마
+        평가 결과를 위한 JSON 스키마 (OpenAI strict json_schema 응답 형식에 사용)
         
         Returns:
             Dict[str, Any]: JSON 스키마
         """
-        return {
-            "type": "object",
-            "properties": {
-                "scores": {
-                    "type": "object",
-                    "properties": {
-                        "format": {"type": "number", "description": "양식 준수 점수 (0-100)"},
-                        "balance": {"type": "number", "description": "균형성 점수 (0-100)"},
-                        "readability": {"type": "number", "description": "가독성 점수 (0-100)"},
-                        "completeness": {"type": "number", "description": "완성도 점수 (0-100)"},
-                        "objectivity": {"type": "number", "description": "객관성 점수 (0-100)"}
-                    },
-                    "required": ["format", "balance", "readability", "completeness", "objectivity"]
-                },
-                "pass": {"type": "boolean", "description": "모든 점수가 85점 이상이면 true"},
-                "feedback": {"type": "string", "description": "개선이 필요한 경우 구체적인 피드백, 통과 시 칭찬"},
-                "revisedContent": {"type": "string", "description": "피드백을 바탕으로 수정된 최종 원고"}
-            },
-            "required": ["scores", "pass", "feedback", "revisedContent"]
-        }
\ No newline at end of file
+        # 공유 객체이므로 호출자는 수정하지 않아야 함 (현재는 평가 서비스가 response_format에 그대로 전달)
+        return _EVALUATION_SCHEMA
+
+
+@lru_cache(maxsize=1)
+def get_prompt_generator() -> PromptGenerator:
+    """
+    공유 프롬프트 생성기 반환 (상태가 없으므로 프로세스당 1개만 생성)
+
+    Returns:
+        PromptGenerator: 캐시된 프롬프트 생성기
+    """
+    return PromptGenerator()
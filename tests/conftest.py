@@ -4,63 +4,131 @@ Pytest 설정 및 공통 픽스처
 """
 
 import os
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import orjson
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
-# 테스트 환경 변수 설정
+# 테스트 환경 변수 설정 (main 모듈 import 전에 적용되어야 함)
 os.environ["OPENAI_API_KEY"] = "test_api_key_for_testing"
 os.environ["ENVIRONMENT"] = "testing"
 
-from main import app
-from services.gemini_service import GeminiService
+# 픽스처마다 다시 만들지 않도록 긴 본문 문자열은 모듈 수준에서 한 번만 생성
+_LONG_CONTENT = "이것은 테스트용 컬럼 내용입니다. " * 50  # 충분한 길이
+_SAMPLE_RESPONSE_CONTENT = "이것은 샘플 컬럼 내용입니다. " * 100
 
 
-@pytest.fixture
-def client():
-    """FastAPI 테스트 클라이언트 픽스처"""
-    with TestClient(app) as test_client:
+@dataclass(frozen=True, slots=True)
+class _Src:
+    """테스트용 참고 자료 (title/uri 속성만 가진 불변 객체)"""
+    
+    title: str
+    uri: str
+
+
+# 서비스가 반환하는 생성 컨텐츠 대용 (테스트에서 읽기만 하므로 모듈 수준에서 한 번만 생성)
+_SAMPLE_SOURCES = (
+    _Src("테스트 자료 1", "https://test1.com"),
+    _Src("테스트 자료 2", "https://test2.com")
+)
+_SAMPLE_COLUMN = SimpleNamespace(
+    title="테스트 컬럼 제목",
+    summary="테스트 컬럼 요약입니다.",
+    content=_LONG_CONTENT,
+    sources=_SAMPLE_SOURCES
+)
+
+
+def rjson(response: httpx.Response) -> Any:
+    """
+    응답 본문 JSON 파싱 (stdlib json 대신 orjson으로 bytes를 바로 파싱)
+    
+    Args:
+        response: TestClient/AsyncClient 응답
+        
+    Returns:
+        Any: 파싱된 JSON 값
+    """
+    return orjson.loads(response.content)
+
+
+@pytest.fixture(scope="session")
+def app_instance():
+    """FastAPI 앱 픽스처 (앱이 필요한 테스트가 처음 실행될 때 main을 import, 수집만 할 때는 앱을 만들지 않음)"""
+    from main import app
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(app_instance):
+    """FastAPI 테스트 클라이언트 픽스처 (앱 상태를 바꾸지 않으므로 세션 동안 하나를 재사용)"""
+    with TestClient(app_instance) as test_client:
+        # 첫 요청에만 드는 비용(라우팅/미들웨어 경로 최초 실행)을 세션 시작 시 한 번 치르도록 미리 호출
+        # (Rate Limit 대상이 아닌 경로만 사용: /health는 제외 대상, 없는 경로는 404)
+        test_client.get("/health")
+        test_client.get("/nonexistent-endpoint")
         yield test_client
 
 
 @pytest.fixture
 def mock_gemini_service():
-    """Mock된 Gemini 서비스 픽스처"""
-    service = MagicMock(spec=GeminiService)
-    
-    # generate_column 메서드 모킹
-    service.generate_column = AsyncMock()
-    service.generate_column.return_value = MagicMock(
-        title="테스트 컬럼 제목",
-        summary="테스트 컬럼 요약입니다.",
-        content="이것은 테스트용 컬럼 내용입니다. " * 50,  # 충분한 길이
-        sources=[
-            MagicMock(title="테스트 자료 1", uri="https://test1.com"),
-            MagicMock(title="테스트 자료 2", uri="https://test2.com")
-        ]
-    )
+    """Mock된 Gemini 서비스 픽스처 (spec 검사가 필요 없어 MagicMock 대신 가벼운 네임스페이스 사용)"""
+    return SimpleNamespace(generate_column=AsyncMock(return_value=_SAMPLE_COLUMN))
+
+
+@pytest.fixture
+async def async_client(app_instance):
+    """비동기 테스트용 HTTP 클라이언트 픽스처 (TestClient의 스레드 전환 없이 테스트 이벤트 루프에서 앱을 직접 호출)"""
+    transport = httpx.ASGITransport(app=app_instance)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def content_service():
+    """컨텐츠 생성 서비스 픽스처 (API를 호출하지 않는 메서드 테스트용, 세션 동안 재사용)"""
+    from services.content_generation_service import ContentGenerationService
     
-    return service
+    return ContentGenerationService(api_key="test")
 
 
 @pytest.fixture
+def stub_generate(monkeypatch):
+    """
+    GeminiService.generate_column을 샘플 컬럼을 반환하는 AsyncMock으로 교체 (테스트 종료 시 자동 원복)
+    
+    에러 케이스는 반환된 Mock의 side_effect를, 다른 응답은 return_value를 설정해서 사용합니다.
+    """
+    from services.gemini_service import GeminiService
+    
+    mock = AsyncMock(return_value=_SAMPLE_COLUMN)
+    monkeypatch.setattr(GeminiService, "generate_column", mock)
+    return mock
+
+
+@pytest.fixture(scope="session")
 def sample_column_request():
-    """샘플 컬럼 요청 데이터 픽스처"""
+    """샘플 컬럼 요청 데이터 픽스처 (읽기 전용, 세션 동안 재사용)"""
     return {
         "topic": "최근 대선 여론조사 결과에 대한 분석",
         "maxRevisionAttempts": 3
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_column_response():
-    """샘플 컬럼 응답 데이터 픽스처"""
+    """샘플 컬럼 응답 데이터 픽스처 (읽기 전용, 세션 동안 재사용)"""
     return {
         "success": True,
         "article": {
             "title": "2024 대선 여론조사, 무엇을 말하는가?",
             "summary": "최근 여론조사 결과를 통해 본 유권자 동향과 정치적 함의",
-            "content": "이것은 샘플 컬럼 내용입니다. " * 100,
+            "content": _SAMPLE_RESPONSE_CONTENT,
             "metadata": {
                 "wordCount": 1500,
                 "category": "정치",
@@ -77,44 +145,12 @@ def sample_column_response():
     }
 
 
-@pytest.fixture
-def invalid_column_requests():
-    """유효하지 않은 컬럼 요청 데이터들 픽스처"""
-    return [
-        # 빈 주제
-        {"topic": "", "maxRevisionAttempts": 3},
-        # 너무 짧은 주제
-        {"topic": "A", "maxRevisionAttempts": 3},
-        # 너무 긴 주제
-        {"topic": "A" * 300, "maxRevisionAttempts": 3},
-        # 유효하지 않은 수정 횟수
-        {"topic": "테스트 주제", "maxRevisionAttempts": 0},
-        {"topic": "테스트 주제", "maxRevisionAttempts": 10},
-        # 누락된 필드
-        {"maxRevisionAttempts": 3},
-        # 부적절한 내용
-        {"topic": "욕설이 포함된 주제", "maxRevisionAttempts": 3},
-    ]
-
-
 @pytest.fixture(autouse=True)
-def setup_test_environment():
-    """테스트 환경 자동 설정"""
-    # 테스트 시작 전 설정
-    original_env = os.environ.copy()
-    
-    # 테스트용 환경변수 설정
-    os.environ.update({
-        "ENVIRONMENT": "testing",
-        "RATE_LIMIT_PER_MINUTE": "100",  # 테스트에서는 높은 제한
-        "LOG_LEVEL": "WARNING"  # 테스트 로그 최소화
-    })
-    
-    yield
-    
-    # 테스트 종료 후 원복
-    os.environ.clear()
-    os.environ.update(original_env)
+def setup_test_environment(monkeypatch):
+    """테스트 환경 자동 설정 (바꾸는 키만 설정하고, 테스트 종료 시 monkeypatch가 원복)"""
+    monkeypatch.setenv("ENVIRONMENT", "testing")
+    monkeypatch.setenv("RATE_LIMIT_PER_MINUTE", "100")  # 테스트에서는 높은 제한
+    monkeypatch.setenv("LOG_LEVEL", "WARNING")  # 테스트 로그 최소화
 
 
 # 마커 정의
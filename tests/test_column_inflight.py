@@ -0,0 +1,66 @@
+"""
+동일 조건 컬럼 생성 요청 병합 테스트
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from services.gemini_service import GeminiService
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_generate_column_coalesces_concurrent_requests():
+    """동일 조건의 동시 요청이 컬럼 생성을 한 번만 실행하는지 검증"""
+    column = MagicMock()
+
+    async def slow_generate(*args):
+        await asyncio.sleep(0.01)
+        return column
+
+    svc = GeminiService("test-key", "id", "secret")
+    svc._generate_column = AsyncMock(side_effect=slow_generate)
+
+    first, second = await asyncio.gather(
+        svc.generate_column("주제"),
+        svc.generate_column("주제"),
+    )
+
+    assert first is second is column
+    assert svc._generate_column.await_count == 1
+    assert not svc._column_inflight and not svc._column_waiters
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_generate_column_cancels_when_all_waiters_leave():
+    """기다리는 요청이 모두 취소되면 진행 중인 컬럼 생성도 취소되는지 검증"""
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def never_finishes(*args):
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    svc = GeminiService("test-key", "id", "secret")
+    svc._generate_column = never_finishes
+
+    waiters = [asyncio.create_task(svc.generate_column("주제")) for _ in range(2)]
+    await started.wait()
+
+    # 한 요청만 떠나면 생성은 계속 진행
+    waiters[0].cancel()
+    await asyncio.sleep(0)
+    assert not cancelled.is_set()
+
+    waiters[1].cancel()
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    await asyncio.gather(*waiters, return_exceptions=True)
+    await asyncio.sleep(0)
+    assert not svc._column_inflight and not svc._column_waiters
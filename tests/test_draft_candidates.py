@@ -0,0 +1,74 @@
+"""
+초안 후보 생성 및 선택 테스트
+"""
+
+import httpx
+import pytest
+from openai import APITimeoutError
+from unittest.mock import AsyncMock, MagicMock
+
+from core.exceptions import ContentGenerationException, EvaluationTimeoutException
+from schemas import EvaluationResult
+from services.content_generation_service import ContentGenerationService
+from services.gemini_service import GeminiService
+
+
+def _evaluation(score: float) -> EvaluationResult:
+    """모든 항목이 같은 점수인 미통과 평가 결과"""
+    scores = dict.fromkeys(("format", "balance", "readability", "completeness", "objectivity"), score)
+    return EvaluationResult.model_validate(
+        {"scores": scores, "pass": False, "feedback": "", "revisedContent": "수정본"}
+    )
+
+
+def _service(evaluate_side_effect) -> GeminiService:
+    """후보 A/B를 생성하고 주어진 방식으로 평가하는 서비스"""
+    svc = GeminiService("test-key", "id", "secret", draft_candidates=2)
+    svc.content_generator = MagicMock()
+    svc.content_generator.generate_column_candidates = AsyncMock(return_value=["A", "B"])
+    svc.content_evaluator = MagicMock()
+    svc.content_evaluator.evaluate_and_revise = AsyncMock(side_effect=evaluate_side_effect)
+    return svc
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_draft_best_candidate_skips_timed_out_candidate():
+    """한 후보의 평가가 시간 초과되어도 나머지 후보로 계속 진행하는지 검증"""
+    evaluation = _evaluation(80)
+
+    async def evaluate(content):
+        if content == "A":
+            raise EvaluationTimeoutException()
+        return evaluation
+
+    content, result = await _service(evaluate)._draft_best_candidate("주제", [])
+
+    assert content == "B"
+    assert result is evaluation
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_draft_best_candidate_without_evaluations_returns_first():
+    """모든 후보의 평가가 시간 초과되면 첫 후보를 평가 없이 반환하는지 검증"""
+    content, result = await _service(EvaluationTimeoutException())._draft_best_candidate("주제", [])
+
+    assert content == "A"
+    assert result is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_generate_column_candidates_reports_client_timeout(monkeypatch):
+    """OpenAI 클라이언트의 시간 초과가 일반 오류가 아닌 시간 초과 메시지로 전달되는지 검증"""
+    service = ContentGenerationService(api_key="test")
+    timeout_error = APITimeoutError(request=httpx.Request("POST", "https://api.openai.com"))
+    monkeypatch.setattr(
+        service.client.chat.completions, "create", AsyncMock(side_effect=timeout_error)
+    )
+
+    with pytest.raises(ContentGenerationException) as exc_info:
+        await service.generate_column_candidates("주제", [{"title": "뉴스", "description": "내용"}], n=2)
+
+    assert exc_info.value.detail == "컬럼 생성 API 응답 시간이 초과되었습니다."
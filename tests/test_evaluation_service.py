@@ -0,0 +1,27 @@
+"""
+컨텐츠 평가 서비스 예외 처리 테스트
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core.exceptions import ContentGenerationException
+from services.content_evaluation_service import ContentEvaluationService
+
+# 본문이 비어 있는 평가 API 응답
+_EMPTY_RESPONSE = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=""))])
+
+
+async def test_empty_evaluation_response_is_not_rewrapped(monkeypatch):
+    """빈 응답 예외가 catch-all 처리기에서 다시 감싸지지 않고 원래 메시지로 전달되는지 확인"""
+    service = ContentEvaluationService(api_key="test")
+    monkeypatch.setattr(
+        service.client.chat.completions, "create", AsyncMock(return_value=_EMPTY_RESPONSE)
+    )
+
+    with pytest.raises(ContentGenerationException) as exc_info:
+        await service.evaluate_and_revise("본문")
+
+    assert exc_info.value.detail == "평가 API가 빈 응답을 반환했습니다."
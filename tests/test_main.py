@@ -6,6 +6,34 @@ API 엔드포인트 및 전체적인 애플리케이션 동작을 테스트
 import pytest
 from unittest.mock import patch, AsyncMock
 from fastapi import status
+from pydantic import ValidationError
+
+from schemas import ColumnRequest
+from tests.conftest import rjson
+
+# Content-Type 검사 테스트용 JSON이 아닌 요청 본문
+_NON_JSON_BODY = b"not-a-json-body"
+
+# 요청 크기 제한 테스트용 큰 주제 (10KB 텍스트, 모듈 수준에서 한 번만 생성)
+_LARGE_TOPIC = "A" * 10000
+
+# 유효하지 않은 컬럼 요청 데이터들 (케이스별로 독립된 테스트로 실행)
+INVALID_REQUESTS = (
+    # 빈 주제
+    {"topic": "", "maxRevisionAttempts": 3},
+    # 너무 짧은 주제
+    {"topic": "A", "maxRevisionAttempts": 3},
+    # 너무 긴 주제
+    {"topic": "A" * 300, "maxRevisionAttempts": 3},
+    # 유효하지 않은 수정 횟수
+    {"topic": "테스트 주제", "maxRevisionAttempts": 0},
+    {"topic": "테스트 주제", "maxRevisionAttempts": 10},
+    # 누락된 필드
+    {"maxRevisionAttempts": 3},
+    # 부적절한 내용
+    {"topic": "욕설이 포함된 주제", "maxRevisionAttempts": 3},
+)
+INVALID_REQUEST_IDS = ("empty", "short", "long", "rev0", "rev10", "missing", "profanity")
 
 
 class TestHealthEndpoint:
@@ -17,7 +45,7 @@ class TestHealthEndpoint:
         response = client.get("/health")
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = rjson(response)
         assert data["status"] == "healthy"
         assert "timestamp" in data
     
@@ -25,7 +53,7 @@ class TestHealthEndpoint:
     def test_health_check_response_format(self, client):
         """헬스 체크 응답 형식 테스트"""
         response = client.get("/health")
-        data = response.json()
+        data = rjson(response)
         
         # 응답 구조 검증
         assert isinstance(data, dict)
@@ -37,16 +65,12 @@ class TestGenerateColumnEndpoint:
     """컬럼 생성 엔드포인트 테스트"""
     
     @pytest.mark.unit
-    @patch('main.gemini_service.generate_column')
-    def test_generate_column_success(self, mock_generate, client, sample_column_request, mock_gemini_service):
+    def test_generate_column_success(self, stub_generate, client, sample_column_request):
         """컬럼 생성 성공 테스트"""
-        # Mock 설정
-        mock_generate.return_value = mock_gemini_service.generate_column.return_value
-        
         response = client.post("/api/generate-column", json=sample_column_request)
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = rjson(response)
         
         # 응답 구조 검증
         assert data["success"] is True
@@ -67,23 +91,29 @@ class TestGenerateColumnEndpoint:
         assert "createdDate" in metadata
     
     @pytest.mark.unit
-    def test_generate_column_invalid_requests(self, client, invalid_column_requests):
-        """유효하지 않은 요청 테스트"""
-        for invalid_request in invalid_column_requests:
-            response = client.post("/api/generate-column", json=invalid_request)
-            
-            # 400 (Bad Request) 또는 422 (Validation Error) 상태 코드 예상
-            assert response.status_code in [
-                status.HTTP_400_BAD_REQUEST,
-                status.HTTP_422_UNPROCESSABLE_ENTITY
-            ]
+    @pytest.mark.parametrize("invalid_request", INVALID_REQUESTS, ids=INVALID_REQUEST_IDS)
+    def test_column_request_validation(self, invalid_request):
+        """유효하지 않은 요청은 요청 모델 검증 단계에서 거부 (HTTP 왕복 없이 모델만 검증)"""
+        with pytest.raises(ValidationError):
+            ColumnRequest(**invalid_request)
+    
+    @pytest.mark.unit
+    def test_generate_column_invalid_requests(self, client):
+        """유효하지 않은 요청 테스트 (모델 검증 실패가 API 에러 응답으로 이어지는지 대표 케이스로 확인)"""
+        response = client.post("/api/generate-column", json=INVALID_REQUESTS[0])
+        
+        # 400 (Bad Request) 또는 422 (Validation Error) 상태 코드 예상
+        assert response.status_code in [
+            status.HTTP_400_BAD_REQUEST,
+            status.HTTP_422_UNPROCESSABLE_ENTITY
+        ]
     
     @pytest.mark.unit
-    def test_generate_column_missing_content_type(self, client, sample_column_request):
+    def test_generate_column_missing_content_type(self, client):
         """Content-Type 헤더 누락 테스트"""
         response = client.post(
             "/api/generate-column",
-            data=str(sample_column_request),  # JSON이 아닌 문자열로 전송
+            content=_NON_JSON_BODY,  # JSON이 아닌 본문으로 전송
             headers={"Content-Type": "text/plain"}
         )
         
@@ -97,44 +127,68 @@ class TestGenerateColumnEndpoint:
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
     
     @pytest.mark.unit
-    @patch('main.gemini_service.generate_column')
-    def test_generate_column_service_error(self, mock_generate, client, sample_column_request):
+    def test_generate_column_service_error(self, stub_generate, client, sample_column_request):
         """서비스 에러 처리 테스트"""
         # Mock에서 예외 발생시키기
-        mock_generate.side_effect = Exception("OpenAI API 오류")
+        stub_generate.side_effect = Exception("OpenAI API 오류")
         
         response = client.post("/api/generate-column", json=sample_column_request)
         
         assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-        data = response.json()
+        data = rjson(response)
         assert data["success"] is False
         assert "error" in data
     
     @pytest.mark.unit
-    def test_generate_column_camelcase_response(self, client, mock_gemini_service):
+    def test_generate_column_camelcase_response(self, stub_generate, client):
         """응답이 camelCase 형식인지 테스트"""
-        with patch('main.gemini_service.generate_column', return_value=mock_gemini_service.generate_column.return_value):
-            response = client.post("/api/generate-column", json={
-                "topic": "테스트 주제",
-                "maxRevisionAttempts": 2
-            })
+        response = client.post("/api/generate-column", json={
+            "topic": "테스트 주제",
+            "maxRevisionAttempts": 2
+        })
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = rjson(response)
+        
+        # camelCase 필드명 확인
+        assert "processedDate" in data
+        article = data["article"]
+        metadata = article["metadata"]
+        assert "wordCount" in metadata
+        assert "createdDate" in metadata
+
+
+class TestNewsPreviewCache:
+    """뉴스 미리보기 캐시 테스트"""
+    
+    @pytest.mark.unit
+    def test_confirmed_generation_reuses_preview_cache(self, client, mock_gemini_service):
+        """미리보기에서 캐시한 뉴스를 확정 API가 재사용하고 정리하는지 테스트"""
+        import main
+        
+        news_data = [{"title": "테스트 뉴스", "description": "설명", "pubDate": "2024-01-01"}]
+        request_body = {"topic": "캐시 테스트 주제", "daysBack": 3, "searchMode": "title"}
+        cache_key = "캐시 테스트 주제_3_title"
+        
+        with patch('services.gemini_service.GeminiService._search_latest_news', return_value=(news_data, [])), \
+             patch('services.gemini_service.GeminiService.generate_column_with_news',
+                   return_value=mock_gemini_service.generate_column.return_value) as mock_with_news:
+            preview = client.post("/api/preview-news", json=request_body)
+            assert preview.status_code == status.HTTP_200_OK
+            assert cache_key in main.news_cache
             
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
+            confirmed = client.post("/api/generate-column-confirmed", json={**request_body, "proceed": True})
             
-            # camelCase 필드명 확인
-            assert "processedDate" in data
-            article = data["article"]
-            metadata = article["metadata"]
-            assert "wordCount" in metadata
-            assert "createdDate" in metadata
+            assert confirmed.status_code == status.HTTP_200_OK
+            assert mock_with_news.call_args.kwargs["news_data"] == news_data
+            assert cache_key not in main.news_cache
 
 
 class TestCORSAndSecurity:
     """CORS 및 보안 테스트"""
     
     @pytest.mark.unit
-    def test_cors_headers_present(self, client, sample_column_request):
+    def test_cors_headers_present(self, client):
         """CORS 헤더 존재 확인"""
         response = client.options("/api/generate-column", headers={
             "Origin": "http://localhost:3000",
@@ -147,8 +201,8 @@ class TestCORSAndSecurity:
     
     @pytest.mark.unit
     def test_security_headers_present(self, client):
-        """보안 헤더 존재 확인"""
-        response = client.get("/health")
+        """보안 헤더 존재 확인 (/health는 미들웨어를 건너뛰므로 다른 경로로 확인)"""
+        response = client.get("/nonexistent-endpoint")
         
         # 보안 헤더 확인
         assert "x-content-type-options" in response.headers
@@ -164,13 +218,21 @@ class TestRateLimiting:
     @pytest.mark.unit
     def test_rate_limit_headers(self, client):
         """Rate Limit 관련 헤더 확인"""
-        response = client.get("/health")
+        response = client.get("/nonexistent-endpoint")
         
         # 응답에 처리 시간 헤더 확인
         assert "x-process-time" in response.headers
     
+    @pytest.mark.unit
+    def test_health_check_skips_middlewares(self, client):
+        """헬스 체크는 로깅/보안 미들웨어를 거치지 않음"""
+        response = client.get("/health")
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert "x-process-time" not in response.headers
+    
     @pytest.mark.slow
-    def test_rate_limit_enforcement(self, client, sample_column_request):
+    def test_rate_limit_enforcement(self):
         """Rate Limit 적용 테스트 (실제 환경에서는 스킵)"""
         # 이 테스트는 실제 rate limiting 설정에 따라 조정 필요
         pytest.skip("Rate limiting test requires specific configuration")
@@ -197,9 +259,8 @@ class TestErrorHandling:
     def test_413_request_entity_too_large(self, client):
         """요청 크기 제한 테스트"""
         # 매우 큰 요청 데이터
-        large_topic = "A" * 10000  # 10KB 텍스트
         response = client.post("/api/generate-column", json={
-            "topic": large_topic,
+            "topic": _LARGE_TOPIC,
             "maxRevisionAttempts": 3
         })
         
@@ -214,23 +275,13 @@ class TestAPIDocumentation:
     """API 문서 테스트"""
     
     @pytest.mark.unit
-    def test_openapi_schema_available(self, client):
-        """OpenAPI 스키마 접근 테스트"""
-        response = client.get("/openapi.json")
+    @pytest.mark.parametrize("path", ["/openapi.json", "/docs"])
+    def test_doc_endpoint(self, client, path):
+        """OpenAPI 스키마/문서 엔드포인트 접근 테스트"""
+        response = client.get(path)
         
         # 개발 환경에서만 접근 가능
         assert response.status_code in [
             status.HTTP_200_OK,
             status.HTTP_404_NOT_FOUND  # 프로덕션에서는 비활성화
         ]
-    
-    @pytest.mark.unit
-    def test_docs_endpoint(self, client):
-        """문서 엔드포인트 접근 테스트"""
-        response = client.get("/docs")
-        
-        # 개발 환경에서만 접근 가능
-        assert response.status_code in [
-            status.HTTP_200_OK,
-            status.HTTP_404_NOT_FOUND  # 프로덕션에서는 비활성화
-        ]
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""
+뉴스 검색 결과 캐시 테스트
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from services.gemini_service import GeminiService
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_latest_news_caches_and_coalesces_requests():
+    """동일 조건의 동시/반복 검색이 네이버 API를 한 번만 호출하는지 검증"""
+    news_data = [{"title": "테스트 뉴스", "link": "https://example.com"}]
+
+    async def slow_search(**kwargs):
+        await asyncio.sleep(0.01)
+        return news_data
+
+    svc = GeminiService("test-key", "id", "secret", news_cache_size=8)
+    svc.news_searcher = MagicMock()
+    svc.news_searcher.search_recent_news = AsyncMock(side_effect=slow_search)
+    svc.news_searcher.convert_to_sources.return_value = [{"title": "테스트 뉴스", "uri": "https://example.com"}]
+
+    first, second = await asyncio.gather(
+        svc._search_latest_news("주제", 7, "title"),
+        svc._search_latest_news("주제", 7, "title"),
+    )
+    third = await svc._search_latest_news("주제", 7, "title")
+
+    assert first == second == third
+    assert first[0] == news_data
+    assert svc.news_searcher.search_recent_news.await_count == 1
+
+    # 조건이 다르면 별도로 검색
+    await svc._search_latest_news("주제", 3, "title")
+    assert svc.news_searcher.search_recent_news.await_count == 2
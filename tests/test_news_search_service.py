@@ -0,0 +1,32 @@
+"""
+네이버 뉴스 검색 서비스 테스트
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from services.news_search_service import NaverNewsSearchService
+
+# 아이템이 하나인 네이버 API 응답
+_RESPONSE = SimpleNamespace(status_code=200, content=b'{"items": [{"title": "t"}]}')
+
+
+async def _slow_get(*args, **kwargs):
+    await asyncio.sleep(0)
+    return _RESPONSE
+
+
+@pytest.mark.unit
+def test_fetch_page_works_across_event_loops():
+    """호출 한도를 넘는 동시 요청 후 새 이벤트 루프에서 같은 서비스를 다시 사용해도 동작하는지 확인"""
+    service = NaverNewsSearchService("id", "secret")
+    service._get_client = lambda: SimpleNamespace(get=_slow_get)
+
+    async def fetch_many():
+        # 세마포어 한도(10)보다 많이 요청해 대기자가 생기도록 함 (이때 루프에 바인딩됨)
+        return await asyncio.gather(*(service._fetch_page({}) for _ in range(15)))
+
+    for _ in range(2):
+        assert len(asyncio.run(fetch_many())) == 15